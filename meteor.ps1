@@ -323,6 +323,31 @@ $script:FeatureToFlagMapping = @{
     "PerplexityAutoupdate"                                  = "perplexity-autoupdate"
 }
 
+# Filesystem Probe Caches
+# Get-7ZipPath and Get-DefaultAppsDirectory are called repeatedly with the same inputs
+# during a single run (once per CRX extraction / extension setup step). Only positive
+# results are cached, since setup creates these paths mid-run and a miss must be re-probed.
+$script:SevenZipPathCache = $null
+$script:DefaultAppsDirCache = @{}
+
+# Parsed config.json, keyed by full path. Entries carry the file's LastWriteTimeUtc so an
+# edit between calls is picked up; LastPath backs Get-MeteorConfig calls without -ConfigPath.
+$script:MeteorConfigCache = @{ LastPath = $null; Entries = @{} }
+
+# MAC Serialization
+# ConvertTo-ChromiumJson runs for every preference value that gets a MAC. The \uXXXX
+# pattern and its evaluator are built once rather than re-parsed on every call.
+$script:UnicodeEscapeRegex = [regex]::new('\\u([0-9a-fA-F]{4})', [System.Text.RegularExpressions.RegexOptions]::Compiled)
+$script:UnicodeEscapeEvaluator = [System.Text.RegularExpressions.MatchEvaluator]{
+    param($match)
+    $hex = $match.Groups[1].Value.ToUpperInvariant()
+    switch ($hex) {
+        '003E' { '>' }
+        '0027' { "'" }
+        default { "\u$hex" }
+    }
+}
+
 #endregion
 
 #region Helper Functions
@@ -531,17 +556,78 @@ function New-DirectoryIfNotExists {
     }
 }
 
+function Move-DirectoryTree {
+    <#
+    .SYNOPSIS
+        Move a directory tree to a new location.
+    .DESCRIPTION
+        Same-volume moves are a single directory rename. Move-Item cannot move a
+        directory across volumes (e.g. %TEMP% on C: to a target on D:), so those go
+        through robocopy /MOVE with multi-threaded copying; a Chrome-bin tree is
+        thousands of small files where per-file open/close dominates. Falls back to
+        Copy-Item -Recurse + Remove-Item when robocopy is unavailable.
+    #>
+    param(
+        [string]$Source,
+        [string]$Destination
+    )
+
+    $sourceFull = [System.IO.Path]::GetFullPath($Source)
+    $destinationFull = [System.IO.Path]::GetFullPath($Destination)
+
+    if ([string]::Equals([System.IO.Path]::GetPathRoot($sourceFull), [System.IO.Path]::GetPathRoot($destinationFull),
+            [System.StringComparison]::OrdinalIgnoreCase)) {
+        Move-Item -Path $sourceFull -Destination $destinationFull -Force
+        return
+    }
+
+    $robocopy = Get-Command -Name "robocopy.exe" -CommandType Application -ErrorAction SilentlyContinue |
+        Select-Object -First 1
+    if ($robocopy) {
+        Write-VerboseTimestamped "Moving across volumes with robocopy: $sourceFull -> $destinationFull"
+        & $robocopy.Source $sourceFull $destinationFull /E /MOVE /MT:32 /R:1 /W:1 /NFL /NDL /NJH /NJS /NP | Out-Null
+        # robocopy exit codes 0-7 are success variants; 8 and above mean at least one failure
+        if ($LASTEXITCODE -lt 8) {
+            return
+        }
+        Write-VerboseTimestamped "robocopy failed (exit code $LASTEXITCODE), falling back to Copy-Item"
+    }
+
+    # Copy contents rather than the folder itself, in case robocopy already created the destination
+    New-DirectoryIfNotExists -Path $destinationFull
+    Copy-Item -Path (Join-Path $sourceFull '*') -Destination $destinationFull -Recurse -Force
+    Remove-Item -Path $sourceFull -Recurse -Force -ErrorAction SilentlyContinue
+}
+
+function Get-TextFile {
+    <#
+    .SYNOPSIS
+        Read a whole text file as UTF-8.
+    .DESCRIPTION
+        Single File.ReadAllText call instead of Get-Content -Raw, which goes through
+        the provider pipeline and, on PS 5.1, decodes BOM-less files (Chromium's
+        Local State / Preferences) with the ANSI code page. Throws if the file
+        cannot be read.
+    #>
+    param([string]$Path)
+
+    $fullPath = $ExecutionContext.SessionState.Path.GetUnresolvedProviderPathFromPSPath($Path)
+    return [System.IO.File]::ReadAllText($fullPath, [System.Text.Encoding]::UTF8)
+}
+
 function Get-JsonFile {
     <#
     .SYNOPSIS
         Read and parse a JSON file.
     .DESCRIPTION
-        Wrapper for Get-Content + ConvertFrom-Json with consistent UTF8 encoding.
+        Wrapper for ConvertFrom-Json with consistent UTF8 encoding.
+        Reads via Get-TextFile rather than Get-Content -Raw to skip the
+        provider pipeline (config.json and Secure Preferences are loaded
+        several times per run).
     #>
     param([string]$Path)
 
-    $content = Get-Content -Path $Path -Raw -Encoding UTF8
-    return $content | ConvertFrom-Json
+    return ConvertFrom-Json -InputObject (Get-TextFile -Path $Path)
 }
 
 function Save-JsonFile {
@@ -549,7 +635,10 @@ function Save-JsonFile {
     .SYNOPSIS
         Save object to JSON file.
     .DESCRIPTION
-        Wrapper for ConvertTo-Json + Set-Content with consistent UTF8 encoding and depth.
+        Wrapper for ConvertTo-Json with consistent UTF8 encoding and depth.
+        The JSON is serialized in memory and written with a single File.WriteAllText
+        call, bypassing the provider pipeline. It always writes a UTF-8 BOM and a
+        trailing newline, matching Set-Content -Encoding UTF8 on PowerShell 5.1.
     #>
     param(
         [string]$Path,
@@ -559,7 +648,8 @@ function Save-JsonFile {
     )
 
     $json = ConvertTo-Json -InputObject $Object -Depth $Depth -Compress:$Compress
-    Set-Content -Path $Path -Value $json -Encoding UTF8
+    $fullPath = $ExecutionContext.SessionState.Path.GetUnresolvedProviderPathFromPSPath($Path)
+    [System.IO.File]::WriteAllText($fullPath, $json + [Environment]::NewLine, [System.Text.Encoding]::UTF8)
 }
 
 function Test-IsEmptyContainer {
@@ -686,11 +776,19 @@ function Get-NestedValue {
     $current = $Object
 
     foreach ($part in $parts) {
-        if ($current -is [hashtable] -and $current.ContainsKey($part)) {
+        if ($current -is [hashtable]) {
+            if (-not $current.ContainsKey($part)) {
+                return @{ Found = $false; Value = $null }
+            }
             $current = $current[$part]
         }
-        elseif ($current -is [PSCustomObject] -and $current.PSObject.Properties.Name -contains $part) {
-            $current = $current.$part
+        elseif ($current -is [PSCustomObject]) {
+            # Direct property lookup ($null when absent) instead of scanning Properties.Name
+            $prop = $current.PSObject.Properties[$part]
+            if ($null -eq $prop) {
+                return @{ Found = $false; Value = $null }
+            }
+            $current = $prop.Value
         }
         else {
             return @{ Found = $false; Value = $null }
@@ -738,23 +836,31 @@ function Expand-GzipData {
         Decompress gzip-compressed byte array.
     .DESCRIPTION
         Takes a gzip-compressed byte array and returns the decompressed data.
-        Returns $null on decompression failure.
+        Offset/Count select a slice of the array (e.g. one resource inside a PAK's
+        RawBytes) without copying it out first. Returns $null on decompression failure.
     #>
-    param([byte[]]$CompressedBytes)
+    param(
+        [byte[]]$CompressedBytes,
+        [int]$Offset = 0,
+        [int]$Count = -1
+    )
+
+    if ($Count -lt 0) { $Count = $CompressedBytes.Length - $Offset }
 
     $inputStream = $null
     $gzipStream = $null
     $outputStream = $null
 
     try {
-        $inputStream = New-Object System.IO.MemoryStream($CompressedBytes, $false)
+        $inputStream = [System.IO.MemoryStream]::new($CompressedBytes, $Offset, $Count, $false)
         $gzipStream = New-Object System.IO.Compression.GZipStream(
             $inputStream,
             [System.IO.Compression.CompressionMode]::Decompress
         )
         $outputStream = New-Object System.IO.MemoryStream
         $gzipStream.CopyTo($outputStream)
-        return $outputStream.ToArray()
+        # Comma keeps the result a byte[] instead of unrolling it into object[]
+        return ,$outputStream.ToArray()
     }
     catch {
         return $null
@@ -803,18 +909,24 @@ function Test-BinaryContent {
     .DESCRIPTION
         Checks bytes directly for binary indicators (null bytes and control characters).
         Only scans first 8KB for efficiency - avoids full UTF-8 string conversion.
+        Offset/Count restrict the check to a slice of the array.
     .RETURNS
         $true if content appears to be binary, $false if it appears to be text.
     #>
-    param([byte[]]$Bytes)
+    param(
+        [byte[]]$Bytes,
+        [int]$Offset = 0,
+        [int]$Count = -1
+    )
 
     if ($null -eq $Bytes -or $Bytes.Length -eq 0) {
         return $false
     }
+    if ($Count -lt 0) { $Count = $Bytes.Length - $Offset }
 
     # Check first 8KB for binary indicators (sufficient for detection)
-    $checkLength = [Math]::Min($Bytes.Length, 8192)
-    for ($i = 0; $i -lt $checkLength; $i++) {
+    $checkEnd = $Offset + [Math]::Min($Count, 8192)
+    for ($i = $Offset; $i -lt $checkEnd; $i++) {
         $b = $Bytes[$i]
         # Binary indicators: null byte or control chars (except tab=9, LF=10, CR=13)
         if ($b -eq 0 -or ($b -lt 32 -and $b -ne 9 -and $b -ne 10 -and $b -ne 13)) {
@@ -824,6 +936,50 @@ function Test-BinaryContent {
     return $false
 }
 
+function Get-RegexLiteralPrefix {
+    <#
+    .SYNOPSIS
+        Extract the literal text that every match of a regex must start with.
+    .DESCRIPTION
+        Used as a cheap IndexOf probe before running a regex over large content.
+        Returns the leading run of literal characters (backslash-escaped punctuation
+        counts as literal), or an empty string when the pattern has no usable prefix.
+        Conservative by design: patterns containing '|' yield no prefix, and a
+        character followed by a quantifier is left out.
+    #>
+    param([string]$Pattern)
+
+    if ([string]::IsNullOrEmpty($Pattern) -or $Pattern.IndexOf('|') -ge 0) { return '' }
+
+    $metaChars = '.[](){}*+?^$'
+    $prefix = [System.Text.StringBuilder]::new()
+    $i = 0
+    while ($i -lt $Pattern.Length) {
+        $c = $Pattern[$i]
+        $width = 1
+        if ($c -eq '\') {
+            if ($i + 1 -ge $Pattern.Length) { break }
+            $next = $Pattern[$i + 1]
+            # \w, \d, \s, \b, \n etc. are classes, anchors or control escapes - not literals
+            if ([char]::IsLetterOrDigit($next)) { break }
+            $c = $next
+            $width = 2
+        }
+        elseif ($metaChars.IndexOf($c) -ge 0) {
+            break
+        }
+
+        # A quantifier makes this character optional or repeated - stop before it
+        $after = $i + $width
+        if ($after -lt $Pattern.Length -and '*+?{'.IndexOf($Pattern[$after]) -ge 0) { break }
+
+        [void]$prefix.Append($c)
+        $i = $after
+    }
+
+    return $prefix.ToString()
+}
+
 function Find-CometVersionDirectory {
     <#
     .SYNOPSIS
@@ -860,16 +1016,30 @@ function Get-DefaultAppsDirectory {
     #>
     param([string]$CometDir)
 
+    # Reuse a previous hit as long as the directory is still there
+    if ($script:DefaultAppsDirCache.ContainsKey($CometDir)) {
+        $cached = $script:DefaultAppsDirCache[$CometDir]
+        if ([System.IO.Directory]::Exists($cached)) {
+            return $cached
+        }
+        $script:DefaultAppsDirCache.Remove($CometDir)
+    }
+
     $defaultAppsDir = Join-Path $CometDir "default_apps"
-    if (Test-Path $defaultAppsDir) {
+    if ([System.IO.Directory]::Exists($defaultAppsDir)) {
+        $script:DefaultAppsDirCache[$CometDir] = $defaultAppsDir
         return $defaultAppsDir
     }
 
-    # Try version subdirectory
-    $versionDirs = Get-ChildItem -Path $CometDir -Directory -ErrorAction SilentlyContinue
-    foreach ($vDir in $versionDirs) {
-        $subDefaultApps = Join-Path $vDir.FullName "default_apps"
-        if (Test-Path $subDefaultApps) {
+    # Try version subdirectory. EnumerateDirectories yields names straight from the
+    # directory listing (no FileSystemInfo per entry) and stops at the first hit.
+    if (-not [System.IO.Directory]::Exists($CometDir)) {
+        return $null
+    }
+    foreach ($vDir in [System.IO.Directory]::EnumerateDirectories($CometDir)) {
+        $subDefaultApps = [System.IO.Path]::Combine($vDir, "default_apps")
+        if ([System.IO.Directory]::Exists($subDefaultApps)) {
+            $script:DefaultAppsDirCache[$CometDir] = $subDefaultApps
             return $subDefaultApps
         }
     }
@@ -877,6 +1047,33 @@ function Get-DefaultAppsDirectory {
     return $null
 }
 
+function Get-DefaultAppsCrxFiles {
+    <#
+    .SYNOPSIS
+        List the CRX files (and their .meteor-backup copies) in default_apps.
+    .DESCRIPTION
+        Single DirectoryInfo.EnumerateFiles pass filtered on the name, in place of
+        Get-ChildItem piped through Where-Object. Returns FileInfo objects in
+        directory order, so "last one wins" lookups keyed on the base name behave
+        as before.
+    #>
+    param([string]$DefaultAppsDir)
+
+    $crxFiles = [System.Collections.Generic.List[System.IO.FileInfo]]::new()
+    if (-not [System.IO.Directory]::Exists($DefaultAppsDir)) {
+        return ,$crxFiles.ToArray()
+    }
+
+    foreach ($file in [System.IO.DirectoryInfo]::new($DefaultAppsDir).EnumerateFiles('*.crx*')) {
+        if ($file.Name.EndsWith('.crx', [System.StringComparison]::OrdinalIgnoreCase) -or
+            $file.Name.EndsWith('.crx.meteor-backup', [System.StringComparison]::OrdinalIgnoreCase)) {
+            $crxFiles.Add($file)
+        }
+    }
+
+    return ,$crxFiles.ToArray()
+}
+
 function Invoke-MeteorWebRequest {
     <#
     .SYNOPSIS
@@ -942,10 +1139,12 @@ function Invoke-MeteorWebRequest {
 function Invoke-MeteorDownload {
     <#
     .SYNOPSIS
-        Download large files using WebClient for better performance.
+        Download large files (browser installers) straight to disk.
     .DESCRIPTION
-        Uses System.Net.WebClient for downloading large files like browser installers.
-        Provides progress indication via events.
+        Streams the response body into the output file in 1 MiB reads. Progress is
+        reported through Write-Progress once per 1% of the download (or every 256 KiB
+        when the size is unknown) and at most ten times a second, rather than per read,
+        since Write-Progress is far slower than the copy itself. A partial file is removed if the download fails.
     #>
     param(
         [Parameter(Mandatory)]
@@ -958,15 +1157,72 @@ function Invoke-MeteorDownload {
     # Ensure TLS 1.2 is enabled
     [Net.ServicePointManager]::SecurityProtocol = [Net.ServicePointManager]::SecurityProtocol -bor [Net.SecurityProtocolType]::Tls12
 
-    $webClient = New-Object System.Net.WebClient
-    $webClient.Headers.Add("User-Agent", $script:UserAgent)
+    $outPath = $ExecutionContext.SessionState.Path.GetUnresolvedProviderPathFromPSPath($OutFile)
+    $request = [System.Net.HttpWebRequest]::Create($Uri)
+    $request.UserAgent = $script:UserAgent
+
+    $response = $null
+    $responseStream = $null
+    $fileStream = $null
+    $activity = "Downloading $([System.IO.Path]::GetFileName($outPath))"
 
     try {
-        $webClient.DownloadFile($Uri, $OutFile)
+        $response = $request.GetResponse()
+        $totalBytes = $response.ContentLength
+        $responseStream = $response.GetResponseStream()
+        # Network reads usually return far less than the 1 MiB requested; the 1 MiB
+        # FileStream buffer coalesces them into large disk writes, and the file is
+        # sized up front when the length is known instead of growing on every write
+        $fileStream = [System.IO.FileStream]::new($outPath, [System.IO.FileMode]::Create, [System.IO.FileAccess]::Write,
+            [System.IO.FileShare]::None, 1048576, [System.IO.FileOptions]::SequentialScan)
+        if ($totalBytes -gt 0) {
+            $fileStream.SetLength($totalBytes)
+        }
+
+        $buffer = New-Object byte[] 1048576
+        $reportStep = if ($totalBytes -gt 0) { [Math]::Max([long]262144, [long]($totalBytes / 100)) } else { [long]262144 }
+        $nextReport = $reportStep
+        $downloaded = [long]0
+        $progressTimer = [System.Diagnostics.Stopwatch]::StartNew()
+
+        while (($read = $responseStream.Read($buffer, 0, $buffer.Length)) -gt 0) {
+            $fileStream.Write($buffer, 0, $read)
+            $downloaded += $read
+
+            # Fast (cached/CDN) downloads cross many 1% steps per second; cap updates at 10 Hz
+            if ($downloaded -ge $nextReport -and $progressTimer.ElapsedMilliseconds -ge 100) {
+                $nextReport = $downloaded + $reportStep
+                $progressTimer.Restart()
+                $status = "{0:N1} MB" -f ($downloaded / 1MB)
+                if ($totalBytes -gt 0) {
+                    $percent = [Math]::Min(100, [int](($downloaded * 100) / $totalBytes))
+                    Write-Progress -Activity $activity -Status ("$status of {0:N1} MB" -f ($totalBytes / 1MB)) -PercentComplete $percent
+                }
+                else {
+                    Write-Progress -Activity $activity -Status $status
+                }
+            }
+        }
+
+        if ($totalBytes -gt 0 -and $downloaded -ne $totalBytes) {
+            throw "Download incomplete: received $downloaded of $totalBytes bytes"
+        }
+
         return $true
     }
+    catch {
+        if ($fileStream) {
+            $fileStream.Dispose()
+            $fileStream = $null
+        }
+        Remove-Item -LiteralPath $outPath -Force -ErrorAction SilentlyContinue
+        throw
+    }
     finally {
-        $webClient.Dispose()
+        Write-Progress -Activity $activity -Completed
+        if ($fileStream) { $fileStream.Dispose() }
+        if ($responseStream) { $responseStream.Dispose() }
+        if ($response) { $response.Dispose() }
     }
 }
 
@@ -1035,13 +1291,42 @@ function New-EppoConfigBlob {
 #region Configuration
 
 function Get-MeteorConfig {
+    <#
+    .SYNOPSIS
+        Load config.json, reusing the parsed object while the file is unchanged.
+    .DESCRIPTION
+        The config is read by Main, the Secure Preferences/Local State writers and the
+        uBlock setup paths during a single run. The parsed object is cached per full path
+        and revalidated against LastWriteTimeUtc, so only the first call hits the parser.
+        When ConfigPath is omitted, the most recently loaded config (or config.json next
+        to the script) is used.
+    #>
     param([string]$ConfigPath)
 
-    if (-not (Test-Path $ConfigPath)) {
+    if ([string]::IsNullOrEmpty($ConfigPath)) {
+        $ConfigPath = if ($script:MeteorConfigCache.LastPath) { $script:MeteorConfigCache.LastPath } else { Join-Path $PSScriptRoot "config.json" }
+    }
+
+    $fullPath = $ExecutionContext.SessionState.Path.GetUnresolvedProviderPathFromPSPath($ConfigPath)
+    $fileInfo = [System.IO.FileInfo]::new($fullPath)
+    if (-not $fileInfo.Exists) {
         throw "Config not found: $ConfigPath"
     }
 
-    return Get-JsonFile -Path $ConfigPath
+    $cached = $script:MeteorConfigCache.Entries[$fullPath]
+    if ($cached -and $cached.LastWriteTimeUtc -eq $fileInfo.LastWriteTimeUtc) {
+        $script:MeteorConfigCache.LastPath = $fullPath
+        return $cached.Config
+    }
+
+    $config = Get-JsonFile -Path $fullPath
+    $script:MeteorConfigCache.Entries[$fullPath] = @{
+        LastWriteTimeUtc = $fileInfo.LastWriteTimeUtc
+        Config           = $config
+    }
+    $script:MeteorConfigCache.LastPath = $fullPath
+
+    return $config
 }
 
 function Resolve-MeteorPath {
@@ -1065,42 +1350,59 @@ function Test-MeteorConfig {
     .SYNOPSIS
         Validates that the Meteor configuration has all required sections and paths.
     .DESCRIPTION
-        Fails fast with a clear error message if required configuration is missing.
+        Fails with a single error listing everything that is missing, so a broken
+        config can be fixed in one go.
         Called early in the workflow to catch config issues before any changes are made.
     #>
     param([PSCustomObject]$Config)
 
     $requiredSections = @('comet', 'browser', 'extensions', 'paths', 'pak_modifications', 'ublock')
     $requiredPaths = @('patched_extensions', 'ublock', 'state_file', 'patches')
+    $requiredSettings = @(
+        @('browser', 'flags'),
+        @('extensions', 'bundled')
+    )
+
+    # Collect every violation in one pass so a broken config is reported in full.
+    # PSObject.Properties[name] is a direct lookup ($null when absent) rather than
+    # materializing .Properties.Name and scanning it for each key.
+    $problems = New-Object 'System.Collections.Generic.List[string]'
 
     # Check required top-level sections
     foreach ($section in $requiredSections) {
-        if (-not $Config.PSObject.Properties.Name -contains $section) {
-            throw "Config validation failed: missing required section '$section'"
+        $prop = $Config.PSObject.Properties[$section]
+        if ($null -eq $prop) {
+            $problems.Add("missing required section '$section'")
         }
-        if ($null -eq $Config.$section) {
-            throw "Config validation failed: section '$section' is null"
+        elseif ($null -eq $prop.Value) {
+            $problems.Add("section '$section' is null")
         }
     }
 
     # Check required paths
-    foreach ($pathName in $requiredPaths) {
-        if (-not $Config.paths.PSObject.Properties.Name -contains $pathName) {
-            throw "Config validation failed: missing required path 'paths.$pathName'"
-        }
-        if ([string]::IsNullOrWhiteSpace($Config.paths.$pathName)) {
-            throw "Config validation failed: path 'paths.$pathName' is empty"
+    $paths = $Config.PSObject.Properties['paths']
+    if ($null -ne $paths -and $null -ne $paths.Value) {
+        foreach ($pathName in $requiredPaths) {
+            $prop = $paths.Value.PSObject.Properties[$pathName]
+            if ($null -eq $prop) {
+                $problems.Add("missing required path 'paths.$pathName'")
+            }
+            elseif ([string]::IsNullOrWhiteSpace($prop.Value)) {
+                $problems.Add("path 'paths.$pathName' is empty")
+            }
         }
     }
 
-    # Check browser has required settings
-    if (-not $Config.browser.PSObject.Properties.Name -contains 'flags') {
-        throw "Config validation failed: missing 'browser.flags'"
+    # Check browser/extensions have required settings
+    foreach ($setting in $requiredSettings) {
+        $parent = $Config.PSObject.Properties[$setting[0]]
+        if ($null -ne $parent -and $null -ne $parent.Value -and $null -eq $parent.Value.PSObject.Properties[$setting[1]]) {
+            $problems.Add("missing '$($setting[0]).$($setting[1])'")
+        }
     }
 
-    # Check extensions has required settings
-    if (-not $Config.extensions.PSObject.Properties.Name -contains 'bundled') {
-        throw "Config validation failed: missing 'extensions.bundled'"
+    if ($problems.Count -gt 0) {
+        throw "Config validation failed: $($problems -join '; ')"
     }
 
     return $true
@@ -1128,48 +1430,56 @@ function Invoke-Parallel {
         [int]$MaxThreads = 4
     )
 
-    $runspacePool = [runspacefactory]::CreateRunspacePool(1, $MaxThreads)
+    # Never open more runspaces than there are tasks (each one is a full session state)
+    $poolSize = [Math]::Max(1, [Math]::Min($MaxThreads, $Tasks.Count))
+    $runspacePool = [runspacefactory]::CreateRunspacePool(1, $poolSize)
     $runspacePool.Open()
 
-    $runspaces = @()
+    $runspaces = New-Object 'System.Collections.Generic.List[hashtable]'
+    $results = New-Object 'System.Collections.Generic.List[object]'
 
-    foreach ($task in $Tasks) {
-        $powershell = [powershell]::Create()
-        $powershell.RunspacePool = $runspacePool
-        [void]$powershell.AddScript($task.Script)
+    try {
+        foreach ($task in $Tasks) {
+            $powershell = [powershell]::Create()
+            $powershell.RunspacePool = $runspacePool
+            [void]$powershell.AddScript($task.Script)
 
-        # Add arguments positionally (PS 5.1 compatible)
-        foreach ($arg in $task.Args) {
-            [void]$powershell.AddArgument($arg)
-        }
+            # Add arguments positionally (PS 5.1 compatible)
+            foreach ($arg in $task.Args) {
+                [void]$powershell.AddArgument($arg)
+            }
 
-        $runspaces += @{
-            PowerShell = $powershell
-            Handle     = $powershell.BeginInvoke()
+            $runspaces.Add(@{
+                PowerShell = $powershell
+                Handle     = $powershell.BeginInvoke()
+            })
         }
-    }
 
-    # Wait for all to complete and collect results with error handling
-    $results = @()
-    foreach ($rs in $runspaces) {
-        try {
-            $results += $rs.PowerShell.EndInvoke($rs.Handle)
-        }
-        finally {
-            # Surface any errors from the runspace
-            if ($rs.PowerShell.HadErrors) {
-                foreach ($err in $rs.PowerShell.Streams.Error) {
-                    Write-Warning "Parallel task error: $err"
+        # Wait for all to complete and collect results with error handling
+        foreach ($rs in $runspaces) {
+            try {
+                foreach ($item in $rs.PowerShell.EndInvoke($rs.Handle)) {
+                    $results.Add($item)
+                }
+            }
+            finally {
+                # Surface any errors from the runspace
+                if ($rs.PowerShell.HadErrors) {
+                    foreach ($err in $rs.PowerShell.Streams.Error) {
+                        Write-Warning "Parallel task error: $err"
+                    }
                 }
+                $rs.PowerShell.Dispose()
             }
-            $rs.PowerShell.Dispose()
         }
     }
+    finally {
+        # Release the pool even if a task's EndInvoke throws
+        $runspacePool.Close()
+        $runspacePool.Dispose()
+    }
 
-    $runspacePool.Close()
-    $runspacePool.Dispose()
-
-    return , $results  # Comma preserves array in PS 5.1
+    return , $results.ToArray()  # Comma preserves array in PS 5.1
 }
 
 function Start-BackgroundRunspace {
@@ -1279,9 +1589,21 @@ function ConvertTo-Hashtable {
 }
 
 function Get-MeteorState {
+    <#
+    .SYNOPSIS
+        Load the persisted Meteor state, or a fresh default state if none exists.
+    .DESCRIPTION
+        Opens the state file directly and treats a missing file (or parent
+        directory) as first run, instead of a Test-Path probe followed by a
+        second stat and open in Get-JsonFile.
+    #>
     param([string]$StatePath)
 
-    if (-not (Test-Path $StatePath)) {
+    $fullPath = $ExecutionContext.SessionState.Path.GetUnresolvedProviderPathFromPSPath($StatePath)
+    try {
+        $content = [System.IO.File]::ReadAllText($fullPath, [System.Text.Encoding]::UTF8)
+    }
+    catch [System.IO.FileNotFoundException], [System.IO.DirectoryNotFoundException] {
         return @{
             version            = $script:MeteorVersion
             comet_version      = ""
@@ -1292,7 +1614,7 @@ function Get-MeteorState {
         }
     }
 
-    $state = ConvertTo-Hashtable (Get-JsonFile -Path $StatePath)
+    $state = ConvertTo-Hashtable (ConvertFrom-Json -InputObject $content)
 
     # State migration: add pak_state if missing (for existing state files)
     if (-not $state.ContainsKey('pak_state')) {
@@ -1320,12 +1642,17 @@ function Test-FileChanged {
         [hashtable]$State
     )
 
+    # Nothing recorded means "changed" whatever the file holds - skip hashing it
+    $storedHash = $State.file_hashes[$FilePath]
+    if (-not $storedHash) {
+        return $true
+    }
+
     $currentHash = Get-FileHash256 -Path $FilePath
     if (-not $currentHash) {
         return $true
     }
 
-    $storedHash = $State.file_hashes[$FilePath]
     return ($currentHash -ne $storedHash)
 }
 
@@ -1468,6 +1795,66 @@ function Get-PakResource {
     return $null
 }
 
+function Get-PakResourceFromFile {
+    <#
+    .SYNOPSIS
+        Read a single resource directly from a PAK file on disk.
+    .DESCRIPTION
+        Reads only the header, the entry table and the requested resource's bytes,
+        instead of loading the whole file into memory like Read-PakFile. Intended for
+        spot checks of a freshly written PAK. Entry IDs are sorted (Chromium's
+        DataPack relies on this), so the lookup is a binary search over the table.
+    #>
+    param(
+        [string]$Path,
+        [int]$ResourceId
+    )
+
+    $stream = [System.IO.File]::OpenRead($Path)
+    $reader = New-Object System.IO.BinaryReader($stream)
+    try {
+        $version = $reader.ReadUInt32()
+        if ($version -ne 4 -and $version -ne 5) {
+            throw "Unsupported PAK version: $version (expected 4 or 5)"
+        }
+
+        [void]$reader.ReadByte()  # Encoding
+        if ($version -eq 4) {
+            $numResources = [int]$reader.ReadUInt32()
+        }
+        else {
+            [void]$reader.ReadBytes(3)  # Padding
+            $numResources = [int]$reader.ReadUInt16()
+            [void]$reader.ReadUInt16()  # Alias count (aliases are not resolved, as in Get-PakResource)
+        }
+
+        # Resource entries (id:2 + offset:4 = 6 bytes each), including the sentinel
+        $table = $reader.ReadBytes(($numResources + 1) * 6)
+
+        $low = 0
+        $high = $numResources - 1
+        while ($low -le $high) {
+            $mid = [int](($low + $high) / 2)
+            $entry = $mid * 6
+            $id = ConvertTo-LittleEndianUInt16 -Bytes $table -Offset $entry
+            if ($id -eq $ResourceId) {
+                $startOffset = ConvertTo-LittleEndianUInt32 -Bytes $table -Offset ($entry + 2)
+                $endOffset = ConvertTo-LittleEndianUInt32 -Bytes $table -Offset ($entry + 8)
+                [void]$stream.Seek($startOffset, [System.IO.SeekOrigin]::Begin)
+
+                # Use comma to prevent PowerShell from unwrapping single-element arrays
+                return ,$reader.ReadBytes([int]($endOffset - $startOffset))
+            }
+            if ($id -lt $ResourceId) { $low = $mid + 1 } else { $high = $mid - 1 }
+        }
+
+        return $null
+    }
+    finally {
+        $reader.Dispose()
+    }
+}
+
 function Set-PakResource {
     <#
     .SYNOPSIS
@@ -1795,66 +2182,143 @@ function Export-PakResources {
     $binaryCount = 0
     $gzipCount = 0
 
-    # Iterate through all resources (skip sentinel at end)
-    for ($i = 0; $i -lt $Pak.Resources.Count - 1; $i++) {
-        $resource = $Pak.Resources[$i]
-        $resourceId = $resource.Id
+    # Every resource is independent (slice, gunzip, classify, write one file), so the
+    # index range is split into contiguous chunks that run on a runspace pool. Script
+    # functions are not visible inside runspaces, hence the inlined gzip and binary checks
+    # (same rules as Expand-GzipData / Test-BinaryContent). RawBytes and the entry table
+    # are shared by reference and only read.
+    $exportWorker = {
+        param($RawBytes, $Resources, $StartIndex, $EndIndex, $OutputDir)
+
+        $utf8NoBom = [System.Text.UTF8Encoding]::new($false)
+        for ($i = $StartIndex; $i -lt $EndIndex; $i++) {
+            $resourceId = $Resources[$i].Id
+            $startOffset = $Resources[$i].Offset
+            $length = $Resources[$i + 1].Offset - $startOffset
+            if ($length -lt 2) { continue }
+
+            # A failed write must fail the export, not leave a manifest entry for a
+            # missing file; the error is returned and the caller throws on it
+            try {
+                $resourceBytes = New-Object byte[] $length
+                [Array]::Copy($RawBytes, $startOffset, $resourceBytes, 0, $length)
 
-        # Get resource bytes
-        $resourceBytes = Get-PakResource -Pak $Pak -ResourceId $resourceId
-        if ($null -eq $resourceBytes) { continue }
+                # Check if gzip compressed
+                $isGzipped = ($resourceBytes[0] -eq 0x1f -and $resourceBytes[1] -eq 0x8b)
+                $contentBytes = $resourceBytes
+                $wasDecompressed = $false
 
-        [byte[]]$resourceBytes = $resourceBytes
-        if ($resourceBytes.Length -lt 2) { continue }
+                if ($isGzipped) {
+                    $gzipStream = $null
+                    $outputStream = $null
+                    try {
+                        $gzipStream = New-Object System.IO.Compression.GZipStream(
+                            [System.IO.MemoryStream]::new($resourceBytes, $false),
+                            [System.IO.Compression.CompressionMode]::Decompress
+                        )
+                        $outputStream = New-Object System.IO.MemoryStream
+                        $gzipStream.CopyTo($outputStream)
+                        $contentBytes = $outputStream.ToArray()
+                        $wasDecompressed = $true
+                    }
+                    catch {
+                        # Keep the raw bytes, as Expand-GzipData's $null result did
+                    }
+                    finally {
+                        if ($null -ne $gzipStream) { $gzipStream.Dispose() }
+                        if ($null -ne $outputStream) { $outputStream.Dispose() }
+                    }
+                }
 
-        # Check if gzip compressed
-        $isGzipped = ($resourceBytes[0] -eq 0x1f -and $resourceBytes[1] -eq 0x8b)
-        $contentBytes = $resourceBytes
-        $wasDecompressed = $false
+                # Determine if text or binary (null byte or control chars in the first 8KB)
+                $isText = $true
+                $checkLength = [Math]::Min($contentBytes.Length, 8192)
+                for ($j = 0; $j -lt $checkLength; $j++) {
+                    $b = $contentBytes[$j]
+                    if ($b -eq 0 -or ($b -lt 32 -and $b -ne 9 -and $b -ne 10 -and $b -ne 13)) {
+                        $isText = $false
+                        break
+                    }
+                }
 
-        if ($isGzipped) {
-            $gzipCount++
-            $decompressed = Expand-GzipData -CompressedBytes $resourceBytes
-            if ($null -ne $decompressed) {
-                $contentBytes = $decompressed
-                $wasDecompressed = $true
+                if ($isText) {
+                    $fileName = "$resourceId.txt"
+                    $content = [System.Text.Encoding]::UTF8.GetString($contentBytes)
+                    [System.IO.File]::WriteAllText([System.IO.Path]::Combine($OutputDir, $fileName), $content, $utf8NoBom)
+                }
+                else {
+                    $fileName = "$resourceId.bin"
+                    [System.IO.File]::WriteAllBytes([System.IO.Path]::Combine($OutputDir, $fileName), $contentBytes)
+                }
+
+                @{
+                    Id           = $resourceId
+                    IsText       = $isText
+                    File         = $fileName
+                    OriginalSize = $resourceBytes.Length
+                    ContentSize  = $contentBytes.Length
+                    Gzipped      = $isGzipped
+                    Decompressed = $wasDecompressed
+                }
+            }
+            catch {
+                @{ Id = $resourceId; Error = $_.Exception.Message }
             }
         }
+    }
 
-        # Determine if text or binary
-        $isText = -not (Test-BinaryContent -Bytes $contentBytes)
-        $content = $null
-        if ($isText) {
-            $content = [System.Text.Encoding]::UTF8.GetString($contentBytes)
-        }
+    # Skip sentinel at end
+    $resourceCount = $Pak.Resources.Count - 1
+    $outputFullPath = $ExecutionContext.SessionState.Path.GetUnresolvedProviderPathFromPSPath($OutputDir)
+    $workerCount = [Math]::Max(1, [Math]::Min(4, [Environment]::ProcessorCount))
+    $chunkSize = [Math]::Max(1, [int][Math]::Ceiling($resourceCount / $workerCount))
 
-        # Save resource
-        $resourceInfo = @{
-            originalSize = $resourceBytes.Length
-            gzipped      = $isGzipped
-            decompressed = $wasDecompressed
-        }
+    $exportTasks = [System.Collections.Generic.List[hashtable]]::new()
+    for ($start = 0; $start -lt $resourceCount; $start += $chunkSize) {
+        $end = [Math]::Min($start + $chunkSize, $resourceCount)
+        $exportTasks.Add(@{
+            Script = $exportWorker
+            Args   = @($Pak.RawBytes, $Pak.Resources, $start, $end, $outputFullPath)
+        })
+    }
 
-        if ($isText) {
+    $exported = if ($exportTasks.Count -gt 0) { Invoke-Parallel -Tasks $exportTasks.ToArray() -MaxThreads $workerCount } else { @() }
+
+    # Every resource of 2+ bytes must come back written; anything less aborts the export
+    $expectedCount = 0
+    for ($i = 0; $i -lt $resourceCount; $i++) {
+        if ($Pak.Resources[$i + 1].Offset - $Pak.Resources[$i].Offset -ge 2) { $expectedCount++ }
+    }
+    $failed = @($exported | Where-Object { $_.Error })
+    if ($failed.Count -gt 0) {
+        throw "Failed to export resource $($failed[0].Id): $($failed[0].Error)"
+    }
+    if ($exported.Count -ne $expectedCount) {
+        throw "PAK export incomplete: $($exported.Count) of $expectedCount resources written"
+    }
+
+    foreach ($entry in $exported) {
+        if ($entry.Gzipped) { $gzipCount++ }
+
+        if ($entry.IsText) {
             $textCount++
-            $fileName = "$resourceId.txt"
-            $filePath = Join-Path $OutputDir $fileName
-            [System.IO.File]::WriteAllText($filePath, $content, [System.Text.UTF8Encoding]::new($false))
-            $resourceInfo.type = "text"
-            $resourceInfo.file = $fileName
-            $resourceInfo.contentSize = $contentBytes.Length
+            $resourceType = "text"
         }
         else {
             $binaryCount++
-            $fileName = "$resourceId.bin"
-            $filePath = Join-Path $OutputDir $fileName
-            [System.IO.File]::WriteAllBytes($filePath, $contentBytes)
-            $resourceInfo.type = "binary"
-            $resourceInfo.file = $fileName
-            $resourceInfo.contentSize = $contentBytes.Length
+            $resourceType = "binary"
+        }
+
+        $resourceInfo = @{
+            originalSize = $entry.OriginalSize
+            gzipped      = $entry.Gzipped
+            decompressed = $entry.Decompressed
+            type         = $resourceType
+            file         = $entry.File
+            contentSize  = $entry.ContentSize
         }
 
-        $manifest.resources["$resourceId"] = $resourceInfo
+        $manifest.resources["$($entry.Id)"] = $resourceInfo
     }
 
     # Handle aliases
@@ -1914,12 +2378,16 @@ function Import-PakResources {
     $resourceData = @{}
     $sortedIds = $manifest.resources.PSObject.Properties.Name | ForEach-Object { [int]$_ } | Sort-Object
 
+    # Resolve the directory once; the per-resource path is then a plain string combine
+    # instead of a Join-Path / Test-Path provider round trip for each of thousands of files
+    $inputFullPath = $ExecutionContext.SessionState.Path.GetUnresolvedProviderPathFromPSPath($InputDir)
+
     foreach ($idStr in $manifest.resources.PSObject.Properties.Name) {
         $resourceId = [int]$idStr
         $resourceInfo = $manifest.resources.$idStr
-        $filePath = Join-Path $InputDir $resourceInfo.file
+        $filePath = [System.IO.Path]::Combine($inputFullPath, $resourceInfo.file)
 
-        if (-not (Test-Path $filePath)) {
+        if (-not [System.IO.File]::Exists($filePath)) {
             Write-Warning "Resource file not found: $filePath"
             continue
         }
@@ -2087,63 +2555,66 @@ function Test-PakModifications {
         Details  = [System.Collections.ArrayList]@()
     }
 
-    # Build verification patterns from replacement values
-    # We look for the replacement text (what should exist after patching)
-    $verificationPatterns = @()
-    foreach ($mod in $config.pak_modifications.modifications) {
-        $verificationPatterns += @{
-            Description = $mod.description
-            Replacement = $mod.replacement
-            Pattern     = $mod.pattern
-            Found       = $false
-            ResourceIds = [System.Collections.ArrayList]@()
-        }
+    # Build verification state from replacement values
+    # We look for the replacement text (what should exist after patching).
+    # Kept as parallel arrays indexed by modification number: the scan only touches
+    # $replacements and $foundInResource, with no per-pattern hashtable lookups.
+    # A pattern is dropped from the scan once found, so one resource ID per pattern suffices.
+    $modifications = @($config.pak_modifications.modifications)
+    $patternCount = $modifications.Count
+    $descriptions = [string[]]::new($patternCount)
+    $replacements = [string[]]::new($patternCount)
+    $foundInResource = [int[]]::new($patternCount)
+    for ($j = 0; $j -lt $patternCount; $j++) {
+        $descriptions[$j] = $modifications[$j].description
+        $replacements[$j] = $modifications[$j].replacement
+        $foundInResource[$j] = -1
     }
 
     # Track unfound patterns for early exit (using List for PS 5.1 compatibility)
     $unfoundIndices = New-Object 'System.Collections.Generic.List[int]'
-    for ($j = 0; $j -lt $verificationPatterns.Count; $j++) {
+    for ($j = 0; $j -lt $patternCount; $j++) {
         [void]$unfoundIndices.Add($j)
     }
     $totalPatterns = $unfoundIndices.Count
 
     # Scan all text resources
     $scannedCount = 0
+    $rawBytes = $pak.RawBytes
     for ($i = 0; $i -lt $pak.Resources.Count - 1; $i++) {
         $resource = $pak.Resources[$i]
         $resourceId = $resource.Id
 
-        $resourceBytes = Get-PakResource -Pak $pak -ResourceId $resourceId
-        if ($null -eq $resourceBytes) { continue }
-
-        [byte[]]$resourceBytes = $resourceBytes
-        if ($resourceBytes.Length -lt 2) { continue }
+        # Read the resource in place within RawBytes rather than copying it out
+        $startOffset = $resource.Offset
+        $byteLength = $pak.Resources[$i + 1].Offset - $startOffset
+        if ($byteLength -lt 2) { continue }
 
         $scannedCount++
 
         # Check if gzip compressed and decompress
-        $isGzipped = ($resourceBytes[0] -eq 0x1f -and $resourceBytes[1] -eq 0x8b)
-        $contentBytes = $resourceBytes
+        $isGzipped = ($rawBytes[$startOffset] -eq 0x1f -and $rawBytes[$startOffset + 1] -eq 0x8b)
 
         if ($isGzipped) {
-            $decompressed = Expand-GzipData -CompressedBytes $resourceBytes
-            if ($null -eq $decompressed) { continue }
-            $contentBytes = $decompressed
-        }
+            $contentBytes = Expand-GzipData -CompressedBytes $rawBytes -Offset $startOffset -Count $byteLength
+            if ($null -eq $contentBytes) { continue }
 
-        # Skip binary content
-        if (Test-BinaryContent -Bytes $contentBytes) { continue }
-        $content = [System.Text.Encoding]::UTF8.GetString($contentBytes)
+            # Skip binary content
+            if (Test-BinaryContent -Bytes $contentBytes) { continue }
+            $content = [System.Text.Encoding]::UTF8.GetString($contentBytes)
+        }
+        else {
+            if (Test-BinaryContent -Bytes $rawBytes -Offset $startOffset -Count $byteLength) { continue }
+            $content = [System.Text.Encoding]::UTF8.GetString($rawBytes, $startOffset, $byteLength)
+        }
 
         # Check each verification pattern (look for replacement values)
         # Iterate in reverse to safely remove from list during iteration
         for ($k = $unfoundIndices.Count - 1; $k -ge 0; $k--) {
             $patternIdx = $unfoundIndices[$k]
-            $pattern = $verificationPatterns[$patternIdx]
             # Use literal string matching for the replacement value
-            if ($content.Contains($pattern.Replacement)) {
-                $pattern.Found = $true
-                [void]$pattern.ResourceIds.Add($resourceId)
+            if ($content.Contains($replacements[$patternIdx])) {
+                $foundInResource[$patternIdx] = $resourceId
                 # Remove from unfound list
                 [void]$unfoundIndices.RemoveAt($k)
             }
@@ -2157,30 +2628,31 @@ function Test-PakModifications {
     }
 
     # Compile results
-    foreach ($pattern in $verificationPatterns) {
-        if ($pattern.Found) {
-            [void]$results.Verified.Add($pattern.Description)
+    for ($j = 0; $j -lt $patternCount; $j++) {
+        $description = $descriptions[$j]
+        if ($foundInResource[$j] -ge 0) {
+            [void]$results.Verified.Add($description)
             if ($Detailed) {
                 [void]$results.Details.Add(@{
-                    Description = $pattern.Description
+                    Description = $description
                     Status      = "Found"
-                    ResourceIds = $pattern.ResourceIds.ToArray()
-                    Replacement = $pattern.Replacement
+                    ResourceIds = @($foundInResource[$j])
+                    Replacement = $replacements[$j]
                 })
             }
-            Write-Status "  [OK] $($pattern.Description)" -Type Detail
+            Write-Status "  [OK] $description" -Type Detail
         }
         else {
-            [void]$results.Missing.Add($pattern.Description)
+            [void]$results.Missing.Add($description)
             if ($Detailed) {
                 [void]$results.Details.Add(@{
-                    Description = $pattern.Description
+                    Description = $description
                     Status      = "Missing"
                     ResourceIds = @()
-                    Replacement = $pattern.Replacement
+                    Replacement = $replacements[$j]
                 })
             }
-            Write-Status "  [MISSING] $($pattern.Description)" -Type Warning
+            Write-Status "  [MISSING] $description" -Type Warning
         }
     }
 
@@ -2192,7 +2664,7 @@ function Test-PakModifications {
         Write-Status "All $($results.Verified.Count) PAK modifications verified" -Type Info
     }
     else {
-        Write-Status "$($results.Verified.Count)/$($verificationPatterns.Count) PAK modifications verified, $($results.Missing.Count) missing" -Type Warning
+        Write-Status "$($results.Verified.Count)/$patternCount PAK modifications verified, $($results.Missing.Count) missing" -Type Warning
     }
 
     # Return results object
@@ -2568,21 +3040,21 @@ function Get-CrxPublicKey {
 
             # Find the key that matches the CRX ID
             if ($crxId -and $keys.Count -gt 0) {
-                $crxIdHex = [BitConverter]::ToString($crxId).Replace("-", "").ToLower()
+                # Format the ID once and reuse one hasher; the CRX ID is the first
+                # 16 bytes of SHA-256(public key), compared here as hex strings
+                $crxIdHex = [BitConverter]::ToString($crxId)
 
-                foreach ($key in $keys) {
-                    $sha = [System.Security.Cryptography.SHA256]::Create()
-                    try {
+                $sha = [System.Security.Cryptography.SHA256]::Create()
+                try {
+                    foreach ($key in $keys) {
                         $hash = $sha.ComputeHash($key)
-                        $hashHex = [BitConverter]::ToString($hash[0..15]).Replace("-", "").ToLower()
-
-                        if ($hashHex -eq $crxIdHex) {
+                        if ([BitConverter]::ToString($hash, 0, 16) -eq $crxIdHex) {
                             return [Convert]::ToBase64String($key)
                         }
                     }
-                    finally {
-                        $sha.Dispose()
-                    }
+                }
+                finally {
+                    $sha.Dispose()
                 }
             }
 
@@ -2609,7 +3081,8 @@ function Export-CrxToDirectory {
         Extract a CRX file to a directory.
     .DESCRIPTION
         Handles both CRX2 and CRX3 formats by detecting the header and extracting the ZIP payload.
-        Uses streaming to avoid loading the entire CRX file into memory.
+        The ZIP portion is read from memory; a temp .zip is only written for the
+        7-Zip / Expand-Archive fallback.
         Optionally injects the public key into manifest.json for consistent extension ID.
     .OUTPUTS
         System.Boolean
@@ -2631,111 +3104,110 @@ function Export-CrxToDirectory {
         throw "CRX file not found: $CrxPath"
     }
 
-    $tempZip = Join-Path $env:TEMP "meteor_crx_$(Get-Random).zip"
-    $inputStream = $null
-    $outputStream = $null
+    $tempZip = $null
 
     try {
-        # Open input file and read header to find ZIP offset
-        $inputStream = [System.IO.File]::OpenRead($CrxPath)
-
-        $header = New-Object byte[] 16
-        $bytesRead = $inputStream.Read($header, 0, 16)
-        if ($bytesRead -lt 12) {
-            throw "CRX file too small: only $bytesRead bytes"
+        # CRX payloads are a few MB: read the file once and extract the ZIP portion
+        # straight from that buffer instead of copying it out to a temp .zip first
+        $bytes = [System.IO.File]::ReadAllBytes($CrxPath)
+        if ($bytes.Length -lt 16) {
+            throw "CRX file too small: only $($bytes.Length) bytes"
         }
 
         # Validate magic "Cr24"
-        if ($header[0] -ne 0x43 -or $header[1] -ne 0x72 -or $header[2] -ne 0x32 -or $header[3] -ne 0x34) {
+        if ($bytes[0] -ne 0x43 -or $bytes[1] -ne 0x72 -or $bytes[2] -ne 0x32 -or $bytes[3] -ne 0x34) {
             throw "Invalid CRX file: missing Cr24 magic header"
         }
 
         # Calculate ZIP offset
-        $version = [BitConverter]::ToUInt32($header, 4)
+        $version = [BitConverter]::ToUInt32($bytes, 4)
         if ($version -eq 2) {
-            $pubkeyLen = [BitConverter]::ToUInt32($header, 8)
-            $sigLen = [BitConverter]::ToUInt32($header, 12)
+            $pubkeyLen = [BitConverter]::ToUInt32($bytes, 8)
+            $sigLen = [BitConverter]::ToUInt32($bytes, 12)
             $zipOffset = 16 + $pubkeyLen + $sigLen
         }
         elseif ($version -eq 3) {
-            $headerLen = [BitConverter]::ToUInt32($header, 8)
+            $headerLen = [BitConverter]::ToUInt32($bytes, 8)
             $zipOffset = 12 + $headerLen
         }
         else {
             throw "Unsupported CRX version: $version"
         }
 
-        $zipLength = $inputStream.Length - $zipOffset
+        $zipLength = $bytes.Length - $zipOffset
         if ($zipLength -le 0) {
             throw "CRX file has no ZIP content (ZIP length: $zipLength)"
         }
+        $zipOffset = [int]$zipOffset
+        $zipLength = [int]$zipLength
 
-        # Seek to ZIP start and validate ZIP magic
-        $inputStream.Seek($zipOffset, [System.IO.SeekOrigin]::Begin) | Out-Null
-        $zipMagic = New-Object byte[] 4
-        $inputStream.Read($zipMagic, 0, 4) | Out-Null
-        if ($zipMagic[0] -ne 0x50 -or $zipMagic[1] -ne 0x4B) {
+        # Validate ZIP magic
+        if ($zipLength -lt 2 -or $bytes[$zipOffset] -ne 0x50 -or $bytes[$zipOffset + 1] -ne 0x4B) {
             throw "CRX file contains invalid ZIP archive (missing PK signature at offset $zipOffset)"
         }
 
-        # Stream ZIP portion to temp file (64KB buffer)
-        $inputStream.Seek($zipOffset, [System.IO.SeekOrigin]::Begin) | Out-Null
-        $outputStream = [System.IO.File]::Create($tempZip)
-        $buffer = New-Object byte[] 65536
-        $remaining = $zipLength
-        while ($remaining -gt 0) {
-            $toRead = [Math]::Min($buffer.Length, $remaining)
-            $read = $inputStream.Read($buffer, 0, $toRead)
-            if ($read -eq 0) { break }
-            $outputStream.Write($buffer, 0, $read)
-            $remaining -= $read
-        }
-        $outputStream.Close()
-        $outputStream = $null
-        $inputStream.Close()
-        $inputStream = $null
-
         if (Test-Path $OutputDir) {
             Remove-Item -Path $OutputDir -Recurse -Force
         }
 
         New-Item -Path $OutputDir -ItemType Directory -Force | Out-Null
 
-        # Use 7-Zip if available (2-5x faster than Expand-Archive)
-        $sevenZip = Get-7ZipPath
-        if ($sevenZip) {
-            # -bso0 -bsp0 = suppress stdout/progress output, -y = yes to all prompts
-            $null = & $sevenZip x $tempZip "-o$OutputDir" -y -bso0 -bsp0 2>$null
-            if ($LASTEXITCODE -ne 0) {
-                # Fallback to Expand-Archive if 7-Zip fails
-                Write-VerboseTimestamped "[CRX] 7-Zip extraction failed (exit code $LASTEXITCODE), falling back to Expand-Archive"
-                Expand-Archive -Path $tempZip -DestinationPath $OutputDir -Force
+        # Extract in-process with System.IO.Compression. CRX payloads are small, so
+        # starting a 7z.exe process per extension cost more than the extraction itself.
+        $extracted = $false
+        try {
+            Add-Type -AssemblyName System.IO.Compression, System.IO.Compression.FileSystem -ErrorAction Stop
+            $zipStream = [System.IO.MemoryStream]::new($bytes, $zipOffset, $zipLength, $false)
+            $archive = [System.IO.Compression.ZipArchive]::new($zipStream, [System.IO.Compression.ZipArchiveMode]::Read)
+            try {
+                [System.IO.Compression.ZipFileExtensions]::ExtractToDirectory($archive, $OutputDir)
+            }
+            finally {
+                $archive.Dispose()
+                $zipStream.Dispose()
             }
+            $extracted = $true
         }
-        else {
-            # Fallback to Expand-Archive (slower but always available)
-            Expand-Archive -Path $tempZip -DestinationPath $OutputDir -Force
+        catch {
+            Write-VerboseTimestamped "[CRX] In-process extraction failed ($($_.Exception.Message)), falling back to 7-Zip / Expand-Archive"
+            # Clear any partial output before the external extractor runs
+            Remove-Item -Path $OutputDir -Recurse -Force -ErrorAction SilentlyContinue
+            New-Item -Path $OutputDir -ItemType Directory -Force | Out-Null
         }
 
-        # Inject public key into manifest if requested
-        if ($InjectKey) {
-            $publicKey = Get-CrxPublicKey -CrxPath $CrxPath
-            $manifestPath = Join-Path $OutputDir "manifest.json"
-
-            if ((Test-Path $manifestPath) -and $publicKey) {
-                $manifest = Get-JsonFile -Path $manifestPath
-
-                # Add key as first property for readability
-                $manifest | Add-Member -NotePropertyName "key" -NotePropertyValue $publicKey -Force
+        if (-not $extracted) {
+            # The external extractors need the ZIP on disk
+            $tempZip = Join-Path $env:TEMP "meteor_crx_$(Get-Random).zip"
+            $zipFile = [System.IO.File]::Create($tempZip)
+            try {
+                $zipFile.Write($bytes, $zipOffset, $zipLength)
+            }
+            finally {
+                $zipFile.Dispose()
+            }
 
-                Save-JsonFile -Path $manifestPath -Object $manifest -Depth 20
+            $sevenZip = Get-7ZipPath
+            if ($sevenZip) {
+                # -bso0 -bsp0 = suppress stdout/progress output, -y = yes to all prompts
+                $null = & $sevenZip x $tempZip "-o$OutputDir" -y -bso0 -bsp0 2>$null
+                if ($LASTEXITCODE -ne 0) {
+                    # Fallback to Expand-Archive if 7-Zip fails
+                    Write-VerboseTimestamped "[CRX] 7-Zip extraction failed (exit code $LASTEXITCODE), falling back to Expand-Archive"
+                    Expand-Archive -Path $tempZip -DestinationPath $OutputDir -Force
+                }
+            }
+            else {
+                Expand-Archive -Path $tempZip -DestinationPath $OutputDir -Force
             }
         }
+
+        # Inject public key into manifest if requested
+        if ($InjectKey) {
+            Add-CrxKeyToManifest -CrxPath $CrxPath -OutputDir $OutputDir
+        }
     }
     finally {
-        if ($outputStream) { $outputStream.Dispose() }
-        if ($inputStream) { $inputStream.Dispose() }
-        if (Test-Path $tempZip) {
+        if ($tempZip -and (Test-Path $tempZip)) {
             Remove-Item -Path $tempZip -Force
         }
     }
@@ -2743,6 +3215,35 @@ function Export-CrxToDirectory {
     return $true
 }
 
+function Add-CrxKeyToManifest {
+    <#
+    .SYNOPSIS
+        Inject a CRX's public key into an extracted extension's manifest.json.
+    .DESCRIPTION
+        Keeps the extension ID stable when loading the unpacked directory.
+        Used by Export-CrxToDirectory -InjectKey, and by the patch step for extensions
+        without manifest_additions (those get the key in the same manifest write).
+        Pass PublicKey when the key was already read and the CRX may be gone.
+    #>
+    param(
+        [string]$CrxPath,
+        [string]$OutputDir,
+        [string]$PublicKey
+    )
+
+    $publicKey = if ($PublicKey) { $PublicKey } else { Get-CrxPublicKey -CrxPath $CrxPath }
+    $manifestPath = Join-Path $OutputDir "manifest.json"
+
+    if ((Test-Path $manifestPath) -and $publicKey) {
+        $manifest = Get-JsonFile -Path $manifestPath
+
+        # Add key as first property for readability
+        $manifest | Add-Member -NotePropertyName "key" -NotePropertyValue $publicKey -Force
+
+        Save-JsonFile -Path $manifestPath -Object $manifest -Depth 20
+    }
+}
+
 function Get-CrxManifest {
     <#
     .SYNOPSIS
@@ -3238,7 +3739,7 @@ function Get-CometInstallation {
         Checks for Comet in the following order:
         1. Portable installation in DataPath/comet
         2. System-wide installations in common locations
-        3. PATH search via where.exe
+        3. PATH search via Get-Command
     #>
     param(
         [string]$DataPath
@@ -3274,15 +3775,19 @@ function Get-CometInstallation {
     }
 
     # Check system-wide installations
+    # Paths are joined lazily, stopping at the first hit and skipping unset roots
+    # (ProgramFiles(x86) is absent on 32-bit Windows, and Join-Path rejects $null)
     $searchPaths = @(
-        (Join-Path $env:LOCALAPPDATA "Perplexity\Comet\Application\comet.exe"),
-        (Join-Path $env:LOCALAPPDATA "Comet\Application\comet.exe"),
-        (Join-Path $env:ProgramFiles "Comet\Application\comet.exe"),
-        (Join-Path ${env:ProgramFiles(x86)} "Comet\Application\comet.exe")
+        @($env:LOCALAPPDATA, "Perplexity\Comet\Application\comet.exe"),
+        @($env:LOCALAPPDATA, "Comet\Application\comet.exe"),
+        @($env:ProgramFiles, "Comet\Application\comet.exe"),
+        @(${env:ProgramFiles(x86)}, "Comet\Application\comet.exe")
     )
 
-    foreach ($path in $searchPaths) {
-        if ($path -and (Test-Path $path)) {
+    foreach ($entry in $searchPaths) {
+        if (-not $entry[0]) { continue }
+        $path = Join-Path $entry[0] $entry[1]
+        if ([System.IO.File]::Exists($path)) {
             return @{
                 Executable = $path
                 Directory  = Split-Path -Parent $path
@@ -3291,22 +3796,17 @@ function Get-CometInstallation {
         }
     }
 
-    # Try where.exe
-    try {
-        $whereResult = & where.exe comet 2>$null
-        if ($whereResult) {
-            $exe = ($whereResult -split "`n")[0].Trim()
-            return @{
-                Executable = $exe
-                Directory  = Split-Path -Parent $exe
-                Portable   = $false
-            }
+    # Search PATH in-process (PATHEXT-aware) instead of spawning where.exe
+    $pathCommand = Get-Command -Name "comet" -CommandType Application -ErrorAction SilentlyContinue |
+        Select-Object -First 1
+    if ($pathCommand) {
+        $exe = $pathCommand.Path
+        return @{
+            Executable = $exe
+            Directory  = Split-Path -Parent $exe
+            Portable   = $false
         }
     }
-    catch {
-        # where.exe not available or failed - continue to return $null
-        $null = $_.Exception
-    }
 
     return $null
 }
@@ -3376,28 +3876,35 @@ function Get-7ZipPath {
     <#
     .SYNOPSIS
         Find 7-Zip executable or return null if not found.
+    .DESCRIPTION
+        The first successful lookup is cached for the rest of the run; each CRX
+        extraction calls this.
     #>
+    if ($script:SevenZipPathCache -and [System.IO.File]::Exists($script:SevenZipPathCache)) {
+        return $script:SevenZipPathCache
+    }
+
     $searchPaths = @(
-        (Join-Path $env:ProgramFiles "7-Zip\7z.exe"),
-        (Join-Path ${env:ProgramFiles(x86)} "7-Zip\7z.exe"),
-        (Join-Path $env:LOCALAPPDATA "Programs\7-Zip\7z.exe")
+        @($env:ProgramFiles, "7-Zip\7z.exe"),
+        @(${env:ProgramFiles(x86)}, "7-Zip\7z.exe"),
+        @($env:LOCALAPPDATA, "Programs\7-Zip\7z.exe")
     )
 
-    foreach ($path in $searchPaths) {
-        if ($path -and (Test-Path $path)) {
+    foreach ($entry in $searchPaths) {
+        if (-not $entry[0]) { continue }
+        $path = Join-Path $entry[0] $entry[1]
+        if ([System.IO.File]::Exists($path)) {
+            $script:SevenZipPathCache = $path
             return $path
         }
     }
 
-    # Try PATH
-    try {
-        $whereResult = & where.exe 7z.exe 2>$null
-        if ($whereResult) {
-            return ($whereResult -split "`n")[0].Trim()
-        }
-    }
-    catch {
-        $null = $_.Exception
+    # Try PATH (in-process lookup, no where.exe spawn)
+    $pathCommand = Get-Command -Name "7z.exe" -CommandType Application -ErrorAction SilentlyContinue |
+        Select-Object -First 1
+    if ($pathCommand) {
+        $script:SevenZipPathCache = $pathCommand.Path
+        return $script:SevenZipPathCache
     }
 
     return $null
@@ -3539,7 +4046,7 @@ function Install-CometPortable {
 
         # Move Chrome-bin to target
         Write-Status "Installing to: $cometDir" -Type Detail
-        Move-Item -Path $chromeBin -Destination $cometDir -Force
+        Move-DirectoryTree -Source $chromeBin -Destination $cometDir
 
         # Find the executable
         $cometExe = Join-Path $cometDir "comet.exe"
@@ -4084,9 +4591,20 @@ function Build-TelemetryDnrRules {
         [switch]$EppoPassthrough
     )
 
-    $rules = @()
+    $rules = New-Object 'System.Collections.Generic.List[object]'
     $ruleId = 1
 
+    # Actions and resource-type lists are identical across rules; build each once and
+    # share the instances (ConvertTo-Json writes a shared reference out in full each time)
+    $blockAction = @{ type = "block" }
+    $redirectAction = @{
+        type     = "redirect"
+        redirect = @{ url = "data:application/json,{}" }
+    }
+    $scriptTypes = @("script")
+    $xhrTypes = @("xmlhttprequest", "ping", "other")
+    $eppoTypes = @("script", "xmlhttprequest", "ping", "other")
+
     # Rule 1: Block ALL subresources until uBlock is ready
     # This is overridden by a dynamic allow-all rule (priority 200) when uBlock signals ready
     # Main frame is allowed so the page structure can load
@@ -4104,12 +4622,12 @@ function Build-TelemetryDnrRules {
         $blockAllCondition['excludedInitiatorDomains'] = @($UBlockExtensionId)
     }
 
-    $rules += [ordered]@{
+    $rules.Add([ordered]@{
         id        = $ruleId++
         priority  = 100
-        action    = @{ type = "block" }
+        action    = $blockAction
         condition = $blockAllCondition
-    }
+    })
 
     # Process domains
     if ($TelemetryConfig.PSObject.Properties['domains']) {
@@ -4123,20 +4641,21 @@ function Build-TelemetryDnrRules {
 
             # Block scripts if configured
             if ($config.PSObject.Properties['block_scripts'] -and $config.block_scripts) {
-                $rules += [ordered]@{
+                $rules.Add([ordered]@{
                     id        = $ruleId++
                     priority  = 300
-                    action    = @{ type = "block" }
+                    action    = $blockAction
                     condition = @{
                         urlFilter     = $urlFilter
-                        resourceTypes = @("script")
+                        resourceTypes = $scriptTypes
                     }
-                }
+                })
             }
 
             # Redirect XHR/other if configured
             if ($config.PSObject.Properties['redirect_xhr'] -and $config.redirect_xhr) {
-                $resourceTypes = @("xmlhttprequest", "ping", "other")
+                # += below allocates a new array, so the shared list is never mutated
+                $resourceTypes = $xhrTypes
 
                 # Add main_frame/sub_frame for non-suffix domains (full domain blocks)
                 if (-not $isSuffix) {
@@ -4148,18 +4667,15 @@ function Build-TelemetryDnrRules {
                     $resourceTypes += "image"
                 }
 
-                $rules += [ordered]@{
+                $rules.Add([ordered]@{
                     id        = $ruleId++
                     priority  = 300
-                    action    = @{
-                        type     = "redirect"
-                        redirect = @{ url = "data:application/json,{}" }
-                    }
+                    action    = $redirectAction
                     condition = @{
                         urlFilter     = $urlFilter
                         resourceTypes = $resourceTypes
                     }
-                }
+                })
             }
         }
     }
@@ -4172,31 +4688,28 @@ function Build-TelemetryDnrRules {
 
             # Block scripts if configured
             if ($config.PSObject.Properties['block_scripts'] -and $config.block_scripts) {
-                $rules += [ordered]@{
+                $rules.Add([ordered]@{
                     id        = $ruleId++
                     priority  = 300
-                    action    = @{ type = "block" }
+                    action    = $blockAction
                     condition = @{
                         urlFilter     = $endpointPath
-                        resourceTypes = @("script")
+                        resourceTypes = $scriptTypes
                     }
-                }
+                })
             }
 
             # Redirect XHR/other if configured
             if ($config.PSObject.Properties['redirect_xhr'] -and $config.redirect_xhr) {
-                $rules += [ordered]@{
+                $rules.Add([ordered]@{
                     id        = $ruleId++
                     priority  = 300
-                    action    = @{
-                        type     = "redirect"
-                        redirect = @{ url = "data:application/json,{}" }
-                    }
+                    action    = $redirectAction
                     condition = @{
                         urlFilter     = $endpointPath
-                        resourceTypes = @("xmlhttprequest", "ping", "other")
+                        resourceTypes = $xhrTypes
                     }
-                }
+                })
             }
         }
     }
@@ -4204,19 +4717,19 @@ function Build-TelemetryDnrRules {
     # Process Eppo domains (skip in passthrough mode for debugging)
     if (-not $EppoPassthrough -and $TelemetryConfig.PSObject.Properties['eppo_domains']) {
         foreach ($eppoDomain in $TelemetryConfig.eppo_domains) {
-            $rules += [ordered]@{
+            $rules.Add([ordered]@{
                 id        = $ruleId++
                 priority  = 300
-                action    = @{ type = "block" }
+                action    = $blockAction
                 condition = @{
                     urlFilter     = "||$eppoDomain"
-                    resourceTypes = @("script", "xmlhttprequest", "ping", "other")
+                    resourceTypes = $eppoTypes
                 }
-            }
+            })
         }
     }
 
-    return $rules
+    return $rules.ToArray()
 }
 
 function Build-ContentScriptBlocklist {
@@ -4344,6 +4857,85 @@ function Build-UBlockTelemetryFilters {
     return $filters -join "`n"
 }
 
+function Build-PlaceholderValues {
+    <#
+    .SYNOPSIS
+        Build the __METEOR_*__ placeholder values injected into copied extension files.
+    .DESCRIPTION
+        Everything here derives from config.json alone, so Initialize-PatchedExtensions
+        builds it once and shares it across all extensions that copy files.
+    #>
+    param(
+        [Parameter(Mandatory)]
+        [object]$MeteorConfig,
+
+        [Parameter()]
+        [switch]$EppoPassthrough
+    )
+
+    $placeholderValues = @{}
+
+    # Build combined feature flags from config (simple + complex)
+    $combinedFlags = @{}
+    if ($MeteorConfig.PSObject.Properties['feature_flag_overrides']) {
+        foreach ($prop in $MeteorConfig.feature_flag_overrides.PSObject.Properties) {
+            if ($prop.Name -notlike '_comment*') {
+                $combinedFlags[$prop.Name] = $prop.Value
+            }
+        }
+    }
+    if ($MeteorConfig.PSObject.Properties['feature_flag_complex_overrides']) {
+        foreach ($prop in $MeteorConfig.feature_flag_complex_overrides.PSObject.Properties) {
+            if ($prop.Name -notlike '_comment*') {
+                $combinedFlags[$prop.Name] = $prop.Value
+            }
+        }
+    }
+    $placeholderValues['__METEOR_FEATURE_FLAGS__'] = $combinedFlags | ConvertTo-Json -Depth 10 -Compress
+
+    # Build debug settings
+    $placeholderValues['__METEOR_EPPO_PASSTHROUGH__'] = if ($EppoPassthrough) { 'true' } else { 'false' }
+
+    # Build telemetry blocklist for content-script.js
+    if ($MeteorConfig.PSObject.Properties['telemetry_blocking']) {
+        $blocklistParams = @{ TelemetryConfig = $MeteorConfig.telemetry_blocking }
+        if ($EppoPassthrough) { $blocklistParams['EppoPassthrough'] = $true }
+        $blocklists = Build-ContentScriptBlocklist @blocklistParams
+        # Handle empty arrays explicitly (PowerShell 5.1 quirk: empty array | ConvertTo-Json returns nothing)
+        $placeholderValues['__METEOR_BLOCKED_PATTERNS__'] = if ($blocklists.BlockedPatterns.Count -eq 0) { '[]' } else { $blocklists.BlockedPatterns | ConvertTo-Json -Compress }
+        $placeholderValues['__METEOR_EPPO_ENDPOINTS__'] = if ($blocklists.EppoEndpoints.Count -eq 0) { '[]' } else { $blocklists.EppoEndpoints | ConvertTo-Json -Compress }
+    }
+
+    # Build homepage URL
+    if ($MeteorConfig.PSObject.Properties['urls'] -and $MeteorConfig.urls.PSObject.Properties['homepage']) {
+        $placeholderValues['__METEOR_HOMEPAGE_URL__'] = "`"$($MeteorConfig.urls.homepage)`""
+    }
+
+    # Build enforced preferences
+    if ($MeteorConfig.PSObject.Properties['enforced_preferences']) {
+        $prefs = @{}
+        foreach ($prop in $MeteorConfig.enforced_preferences.PSObject.Properties) {
+            if ($prop.Name -notlike '_comment*') {
+                $prefs[$prop.Name] = $prop.Value
+            }
+        }
+        $placeholderValues['__METEOR_ENFORCED_PREFERENCES__'] = $prefs | ConvertTo-Json -Depth 10 -Compress
+    }
+
+    # Build meteor extensions mapping
+    if ($MeteorConfig.PSObject.Properties['meteor_extensions']) {
+        $exts = @{}
+        foreach ($prop in $MeteorConfig.meteor_extensions.PSObject.Properties) {
+            if ($prop.Name -notlike '_comment*') {
+                $exts[$prop.Name] = $prop.Value
+            }
+        }
+        $placeholderValues['__METEOR_EXTENSIONS__'] = $exts | ConvertTo-Json -Compress
+    }
+
+    return $placeholderValues
+}
+
 function Initialize-PatchedExtensions {
     <#
     .SYNOPSIS
@@ -4374,6 +4966,74 @@ function Initialize-PatchedExtensions {
 
     New-DirectoryIfNotExists -Path $OutputDir
 
+    # Inline CRX extraction worker for Invoke-Parallel (script functions are not
+    # available in runspaces). Extracts the ZIP payload in-process; the manifest key is
+    # written by the patch step, and the 7-Zip fallback stays on the main thread
+    # via Export-CrxToDirectory.
+    $crxExtractWorker = {
+        param($CrxPath, $OutputDir, $ExtName)
+        $stagingDir = $null
+        $oldDir = $null
+        try {
+            $bytes = [System.IO.File]::ReadAllBytes($CrxPath)
+            if ($bytes.Length -lt 12 -or $bytes[0] -ne 0x43 -or $bytes[1] -ne 0x72 -or $bytes[2] -ne 0x32 -or $bytes[3] -ne 0x34) {
+                throw "Invalid CRX file: missing Cr24 magic header"
+            }
+            $version = [BitConverter]::ToUInt32($bytes, 4)
+            $zipOffset = if ($version -eq 2) {
+                16 + [BitConverter]::ToUInt32($bytes, 8) + [BitConverter]::ToUInt32($bytes, 12)
+            }
+            elseif ($version -eq 3) {
+                12 + [BitConverter]::ToUInt32($bytes, 8)
+            }
+            else {
+                throw "Unsupported CRX version: $version"
+            }
+            if ($zipOffset -ge $bytes.Length) {
+                throw "CRX file has no ZIP content"
+            }
+
+            # Extract into a sibling staging directory and swap it in with two renames, so the
+            # previous tree is only deleted after the new one is complete (and survives a failure)
+            $parentDir = [System.IO.Path]::GetDirectoryName($OutputDir)
+            [void][System.IO.Directory]::CreateDirectory($parentDir)
+            $stagingDir = [System.IO.Path]::Combine($parentDir, ".$([System.IO.Path]::GetFileName($OutputDir)).$([Guid]::NewGuid().ToString('N'))")
+
+            Add-Type -AssemblyName System.IO.Compression, System.IO.Compression.FileSystem
+            $zipStream = [System.IO.MemoryStream]::new($bytes, [int]$zipOffset, $bytes.Length - [int]$zipOffset, $false)
+            $archive = [System.IO.Compression.ZipArchive]::new($zipStream, [System.IO.Compression.ZipArchiveMode]::Read)
+            try {
+                [System.IO.Compression.ZipFileExtensions]::ExtractToDirectory($archive, $stagingDir)
+            }
+            finally {
+                $archive.Dispose()
+                $zipStream.Dispose()
+            }
+
+            if ([System.IO.Directory]::Exists($OutputDir)) {
+                $oldDir = "$stagingDir.old"
+                [System.IO.Directory]::Move($OutputDir, $oldDir)
+            }
+            [System.IO.Directory]::Move($stagingDir, $OutputDir)
+            if ($oldDir) {
+                $previousDir = $oldDir
+                $oldDir = $null
+                try { [System.IO.Directory]::Delete($previousDir, $true) } catch { $null = $_ }
+            }
+            return @{ Success = $true; Name = $ExtName }
+        }
+        catch {
+            # The previous tree was moved aside but the new one never replaced it: put it back
+            if ($oldDir -and [System.IO.Directory]::Exists($oldDir) -and -not [System.IO.Directory]::Exists($OutputDir)) {
+                try { [System.IO.Directory]::Move($oldDir, $OutputDir) } catch { $null = $_ }
+            }
+            if ($stagingDir -and [System.IO.Directory]::Exists($stagingDir)) {
+                try { [System.IO.Directory]::Delete($stagingDir, $true) } catch { $null = $_ }
+            }
+            return @{ Success = $false; Name = $ExtName; Error = $_.ToString() }
+        }
+    }
+
     # Build list of extensions to process
     $extensionsToProcess = @{}
 
@@ -4384,9 +5044,9 @@ function Initialize-PatchedExtensions {
     # On fresh install, read CRX versions from the installer's bundled files
     if ($FreshInstall -and $defaultAppsDir) {
         Write-VerboseTimestamped "Fresh install - reading CRX versions from: $defaultAppsDir"
-        Get-ChildItem -Path $defaultAppsDir -Filter "*.crx*" -ErrorAction SilentlyContinue | Where-Object { $_.Extension -eq '.crx' -or $_.Name.EndsWith('.crx.meteor-backup') } | ForEach-Object {
-            $baseName = $_.Name -replace '\.crx(\.meteor-backup)?$', ''
-            $crxManifest = Get-CrxManifest -CrxPath $_.FullName
+        foreach ($crxFile in (Get-DefaultAppsCrxFiles -DefaultAppsDir $defaultAppsDir)) {
+            $baseName = $crxFile.Name -replace '\.crx(\.meteor-backup)?$', ''
+            $crxManifest = Get-CrxManifest -CrxPath $crxFile.FullName
             if ($crxManifest -and $crxManifest.version) {
                 $localCrxVersions[$baseName] = $crxManifest.version
                 Write-VerboseTimestamped "  $baseName local CRX version: $($crxManifest.version)"
@@ -4604,8 +5264,9 @@ function Initialize-PatchedExtensions {
                 $downloadResults = Invoke-Parallel -Tasks $downloadTasks -MaxThreads 4
 
                 # ═══════════════════════════════════════════════════════════════
-                # Phase 4: Sequential extraction (file I/O must be serial)
+                # Phase 4: Parallel extraction (each extension has its own output dir)
                 # ═══════════════════════════════════════════════════════════════
+                $extractTasks = @()
                 foreach ($dlResult in $downloadResults) {
                     $extName = $dlResult.Name
                     $dlInfo = $downloadInfoMap[$extName]
@@ -4631,26 +5292,9 @@ function Initialize-PatchedExtensions {
                         }
 
                         Write-Status "  Extracting: $extName" -Type Detail
-                        try {
-                            if (Test-Path $dlInfo.OutputDir) {
-                                Remove-Item -Path $dlInfo.OutputDir -Recurse -Force
-                            }
-                            $exportResult = Export-CrxToDirectory -CrxPath $dlResult.TempCrx -OutputDir $dlInfo.OutputDir -InjectKey
-                            if ($exportResult) {
-                                $extensionsToProcess[$extName] = @{
-                                    OutputDir     = $dlInfo.OutputDir
-                                    FromServer    = $true
-                                    NeedsFallback = $false
-                                    Version       = $dlInfo.Version
-                                }
-                            }
-                            else {
-                                Write-Status "  $extName`: extraction failed" -Type Warning
-                                $extensionsToProcess[$extName] = @{ OutputDir = $dlInfo.OutputDir; FromServer = $false; NeedsFallback = $true }
-                            }
-                        }
-                        finally {
-                            Remove-Item -Path $dlResult.TempCrx -Force -ErrorAction SilentlyContinue
+                        $extractTasks += @{
+                            Script = $crxExtractWorker
+                            Args   = @($dlResult.TempCrx, $dlInfo.OutputDir, $extName)
                         }
                     }
                     else {
@@ -4664,6 +5308,49 @@ function Initialize-PatchedExtensions {
                         $extensionsToProcess[$extName] = @{ OutputDir = $dlInfo.OutputDir; FromServer = $false; NeedsFallback = $true }
                     }
                 }
+
+                if ($extractTasks.Count -gt 0) {
+                    $extractResults = Invoke-Parallel -Tasks $extractTasks -MaxThreads 4
+                    foreach ($exResult in $extractResults) {
+                        $extName = $exResult.Name
+                        $dlInfo = $downloadInfoMap[$extName]
+                        $manifestKey = $null
+                        try {
+                            if ($exResult.Success) {
+                                # Read the key now (the temp CRX is deleted below); it is written
+                                # together with any manifest_additions in the patch step
+                                $manifestKey = Get-CrxPublicKey -CrxPath $dlInfo.TempCrx
+                                $exportResult = $true
+                            }
+                            else {
+                                # Retry on the main thread, which can fall back to 7-Zip / Expand-Archive
+                                Write-VerboseTimestamped "  $extName`: parallel extraction failed ($($exResult.Error)), retrying"
+                                $exportResult = Export-CrxToDirectory -CrxPath $dlInfo.TempCrx -OutputDir $dlInfo.OutputDir -InjectKey
+                            }
+                        }
+                        catch {
+                            Write-VerboseTimestamped "  $extName`: $($_.Exception.Message)"
+                            $exportResult = $false
+                        }
+                        finally {
+                            Remove-Item -Path $dlInfo.TempCrx -Force -ErrorAction SilentlyContinue
+                        }
+
+                        if ($exportResult) {
+                            $extensionsToProcess[$extName] = @{
+                                OutputDir     = $dlInfo.OutputDir
+                                FromServer    = $true
+                                NeedsFallback = $false
+                                Version       = $dlInfo.Version
+                                ManifestKey   = $manifestKey
+                            }
+                        }
+                        else {
+                            Write-Status "  $extName`: extraction failed" -Type Warning
+                            $extensionsToProcess[$extName] = @{ OutputDir = $dlInfo.OutputDir; FromServer = $false; NeedsFallback = $true }
+                        }
+                    }
+                }
             }
         }
     }
@@ -4691,36 +5378,71 @@ function Initialize-PatchedExtensions {
 
             # Find CRX files (backups first, then active - active takes precedence)
             $crxSources = @{}
-            Get-ChildItem -Path $defaultAppsDir -Filter "*.crx*" -ErrorAction SilentlyContinue | Where-Object { $_.Extension -eq '.crx' -or $_.Name.EndsWith('.crx.meteor-backup') } | ForEach-Object {
-                $baseName = $_.Name -replace '\.crx(\.meteor-backup)?$', ''
-                $crxSources[$baseName] = $_
+            foreach ($crxFile in (Get-DefaultAppsCrxFiles -DefaultAppsDir $defaultAppsDir)) {
+                $baseName = $crxFile.Name -replace '\.crx(\.meteor-backup)?$', ''
+                $crxSources[$baseName] = $crxFile
             }
 
-            # Process fallback extensions
+            # Process fallback extensions: queue every local CRX, then extract them in one parallel batch
+            $fallbackTasks = @()
             foreach ($extName in $extensionsToProcess.Keys) {
                 $extData = $extensionsToProcess[$extName]
                 if (-not $extData.NeedsFallback) { continue }
 
                 if ($crxSources.ContainsKey($extName)) {
-                    $crx = $crxSources[$extName]
                     Write-Status "Processing (local): $extName" -Type Info
 
                     if (-not $WhatIfPreference) {
-                        Export-CrxToDirectory -CrxPath $crx.FullName -OutputDir $extData.OutputDir -InjectKey
-                        Write-Status "Extracted to: $($extData.OutputDir)" -Type Detail
-                        $extData.NeedsFallback = $false
+                        $fallbackTasks += @{
+                            Script = $crxExtractWorker
+                            Args   = @($crxSources[$extName].FullName, $extData.OutputDir, $extName)
+                        }
                     }
                 }
                 else {
                     Write-Status "No local CRX found for: $extName" -Type Warning
                 }
             }
+
+            if ($fallbackTasks.Count -gt 0) {
+                $fallbackResults = Invoke-Parallel -Tasks $fallbackTasks -MaxThreads 4
+                foreach ($exResult in $fallbackResults) {
+                    $extData = $extensionsToProcess[$exResult.Name]
+                    $crxPath = $crxSources[$exResult.Name].FullName
+
+                    if ($exResult.Success) {
+                        $extData.ManifestKey = Get-CrxPublicKey -CrxPath $crxPath
+                    }
+                    else {
+                        # Retry on the main thread, which can fall back to 7-Zip / Expand-Archive
+                        Write-VerboseTimestamped "  $($exResult.Name): parallel extraction failed ($($exResult.Error)), retrying"
+                        Export-CrxToDirectory -CrxPath $crxPath -OutputDir $extData.OutputDir -InjectKey
+                    }
+                    Write-Status "Extracted to: $($extData.OutputDir)" -Type Detail
+                    $extData.NeedsFallback = $false
+                }
+            }
         }
         else {
             Write-Status "No local CRX source available" -Type Warning
         }
     }
 
+    # Debug settings shared by placeholder injection and DNR rule generation
+    $eppoPassthrough = $false
+    if ($MeteorConfig.PSObject.Properties['debug'] -and $MeteorConfig.debug.PSObject.Properties['eppo_passthrough']) {
+        $eppoPassthrough = $MeteorConfig.debug.eppo_passthrough -eq $true
+    }
+
+    # Built lazily by the first extension with copy_files, then reused
+    $placeholderRegex = $null
+    $placeholderEvaluator = $null
+    $dnrRules = $null
+    $dnrJson = $null
+
+    # Patch sources all resolve against the same root; normalize it once for every extension
+    $patchesFullPath = [System.IO.Path]::GetFullPath($PatchesDir)
+
     # Apply patches to all successfully extracted extensions
     foreach ($extName in $extensionsToProcess.Keys) {
         $extData = $extensionsToProcess[$extName]
@@ -4729,83 +5451,48 @@ function Initialize-PatchedExtensions {
         if ($WhatIfPreference) { continue }
         if (-not (Test-Path $extOutputDir)) { continue }
 
+        # Key from parallel extraction, not yet written. Extensions with manifest_additions
+        # get it in that single load/modify/save; the rest write it here.
+        $manifestKey = if ($extData.ContainsKey('ManifestKey')) { $extData.ManifestKey } else { $null }
+        if ($manifestKey -and -not ($PatchConfig.PSObject.Properties[$extName] -and $PatchConfig.$extName.PSObject.Properties['manifest_additions'])) {
+            Add-CrxKeyToManifest -OutputDir $extOutputDir -PublicKey $manifestKey
+            $manifestKey = $null
+        }
+
         # Apply patches if configured (check property exists to avoid StrictMode error)
         if ($PatchConfig.PSObject.Properties[$extName]) {
             $config = $PatchConfig.$extName
 
             # Copy additional files and generate dynamic content
             if ($config.PSObject.Properties['copy_files']) {
-                # Pre-build all placeholder values once
-                $placeholderValues = @{}
-
-                # Build combined feature flags from config (simple + complex)
-                $combinedFlags = @{}
-                if ($MeteorConfig.PSObject.Properties['feature_flag_overrides']) {
-                    foreach ($prop in $MeteorConfig.feature_flag_overrides.PSObject.Properties) {
-                        if ($prop.Name -notlike '_comment*') {
-                            $combinedFlags[$prop.Name] = $prop.Value
-                        }
-                    }
-                }
-                if ($MeteorConfig.PSObject.Properties['feature_flag_complex_overrides']) {
-                    foreach ($prop in $MeteorConfig.feature_flag_complex_overrides.PSObject.Properties) {
-                        if ($prop.Name -notlike '_comment*') {
-                            $combinedFlags[$prop.Name] = $prop.Value
-                        }
-                    }
-                }
-                $placeholderValues['__METEOR_FEATURE_FLAGS__'] = $combinedFlags | ConvertTo-Json -Depth 10 -Compress
+                # Placeholder values only depend on config.json - build them (and the
+                # matching regex) on first use and share them across extensions
+                if ($null -eq $placeholderRegex) {
+                    $placeholderValues = Build-PlaceholderValues -MeteorConfig $MeteorConfig -EppoPassthrough:$eppoPassthrough
 
-                # Build debug settings
-                $eppoPassthrough = $false
-                if ($MeteorConfig.PSObject.Properties['debug'] -and $MeteorConfig.debug.PSObject.Properties['eppo_passthrough']) {
-                    $eppoPassthrough = $MeteorConfig.debug.eppo_passthrough -eq $true
+                    # Single alternation over all placeholder names so each file is scanned once.
+                    # The evaluator inserts values verbatim ('$' in JSON values is not a backreference).
+                    $placeholderPattern = (@($placeholderValues.Keys | ForEach-Object { [regex]::Escape($_) }) -join '|')
+                    $placeholderRegex = [regex]::new($placeholderPattern)
+                    $placeholderEvaluator = [System.Text.RegularExpressions.MatchEvaluator]{
+                        param($m)
+                        $placeholderValues[$m.Value]
+                    }.GetNewClosure()
                 }
-                $placeholderValues['__METEOR_EPPO_PASSTHROUGH__'] = if ($eppoPassthrough) { 'true' } else { 'false' }
 
-                # Build telemetry blocklist for content-script.js
-                if ($MeteorConfig.PSObject.Properties['telemetry_blocking']) {
-                    $blocklistParams = @{ TelemetryConfig = $MeteorConfig.telemetry_blocking }
-                    if ($eppoPassthrough) { $blocklistParams['EppoPassthrough'] = $true }
-                    $blocklists = Build-ContentScriptBlocklist @blocklistParams
-                    # Handle empty arrays explicitly (PowerShell 5.1 quirk: empty array | ConvertTo-Json returns nothing)
-                    $placeholderValues['__METEOR_BLOCKED_PATTERNS__'] = if ($blocklists.BlockedPatterns.Count -eq 0) { '[]' } else { $blocklists.BlockedPatterns | ConvertTo-Json -Compress }
-                    $placeholderValues['__METEOR_EPPO_ENDPOINTS__'] = if ($blocklists.EppoEndpoints.Count -eq 0) { '[]' } else { $blocklists.EppoEndpoints | ConvertTo-Json -Compress }
-                }
-
-                # Build homepage URL
-                if ($MeteorConfig.PSObject.Properties['urls'] -and $MeteorConfig.urls.PSObject.Properties['homepage']) {
-                    $placeholderValues['__METEOR_HOMEPAGE_URL__'] = "`"$($MeteorConfig.urls.homepage)`""
-                }
-
-                # Build enforced preferences
-                if ($MeteorConfig.PSObject.Properties['enforced_preferences']) {
-                    $prefs = @{}
-                    foreach ($prop in $MeteorConfig.enforced_preferences.PSObject.Properties) {
-                        if ($prop.Name -notlike '_comment*') {
-                            $prefs[$prop.Name] = $prop.Value
-                        }
-                    }
-                    $placeholderValues['__METEOR_ENFORCED_PREFERENCES__'] = $prefs | ConvertTo-Json -Depth 10 -Compress
-                }
-
-                # Build meteor extensions mapping
-                if ($MeteorConfig.PSObject.Properties['meteor_extensions']) {
-                    $exts = @{}
-                    foreach ($prop in $MeteorConfig.meteor_extensions.PSObject.Properties) {
-                        if ($prop.Name -notlike '_comment*') {
-                            $exts[$prop.Name] = $prop.Value
-                        }
-                    }
-                    $placeholderValues['__METEOR_EXTENSIONS__'] = $exts | ConvertTo-Json -Compress
-                }
+                # copy_files entries cluster under a few parents (content/, rules/, ...);
+                # probe and create each parent directory once rather than once per file
+                $ensuredDirs = [System.Collections.Generic.HashSet[string]]::new([System.StringComparer]::OrdinalIgnoreCase)
 
                 foreach ($destFile in $config.copy_files.PSObject.Properties) {
-                    $destPath = Join-Path $extOutputDir $destFile.Name
-                    $srcPath = Resolve-MeteorPath -BasePath $PatchesDir -RelativePath $destFile.Value
+                    $destPath = [System.IO.Path]::Combine($extOutputDir, $destFile.Name)
+                    $srcPath = Resolve-MeteorPath -BasePath $patchesFullPath -RelativePath $destFile.Value
 
                     # Ensure directory exists
-                    New-DirectoryIfNotExists -Path (Split-Path -Parent $destPath)
+                    $destDir = [System.IO.Path]::GetDirectoryName($destPath)
+                    if ($ensuredDirs.Add($destDir)) {
+                        New-DirectoryIfNotExists -Path $destDir
+                    }
 
                     # Check if this is telemetry.json - generate dynamically instead of copying
                     if ($destFile.Name -eq 'rules/telemetry.json' -and $MeteorConfig.PSObject.Properties['telemetry_blocking']) {
@@ -4814,34 +5501,39 @@ function Initialize-PatchedExtensions {
                             $MeteorConfig.ublock.extension_id
                         } else { $null }
 
-                        $dnrParams = @{ TelemetryConfig = $MeteorConfig.telemetry_blocking; UBlockExtensionId = $ublockId }
-                        if ($eppoPassthrough) { $dnrParams['EppoPassthrough'] = $true }
-                        $dnrRules = Build-TelemetryDnrRules @dnrParams
-                        $dnrJson = $dnrRules | ConvertTo-Json -Depth 10
+                        if ($null -eq $dnrJson) {
+                            $dnrParams = @{ TelemetryConfig = $MeteorConfig.telemetry_blocking; UBlockExtensionId = $ublockId }
+                            if ($eppoPassthrough) { $dnrParams['EppoPassthrough'] = $true }
+                            $dnrRules = Build-TelemetryDnrRules @dnrParams
+                            $dnrJson = $dnrRules | ConvertTo-Json -Depth 10
+                        }
                         [System.IO.File]::WriteAllText($destPath, $dnrJson, [System.Text.UTF8Encoding]::new($false))
                         Write-Status "Generated: $($destFile.Name) ($($dnrRules.Count) rules)" -Type Detail
                         continue
                     }
 
-                    if (Test-Path $srcPath) {
-                        Copy-Item -Path $srcPath -Destination $destPath -Force
-
-                        # Inject placeholders if this is a JS file
+                    $srcFullPath = [System.IO.Path]::GetFullPath($srcPath)
+                    if ([System.IO.File]::Exists($srcFullPath)) {
                         if ($destPath -match '\.js$') {
-                            $content = Get-Content -Path $destPath -Raw -Encoding UTF8
-                            $modified = $false
-
-                            foreach ($placeholder in $placeholderValues.Keys) {
-                                if ($content -match [regex]::Escape($placeholder)) {
-                                    $content = $content -replace [regex]::Escape($placeholder), $placeholderValues[$placeholder]
-                                    $modified = $true
-                                }
-                            }
-
-                            if ($modified) {
+                            # JS files may need placeholder injection: read the source once and write the
+                            # destination once, instead of copying and then reading the copy back.
+                            # Files without placeholders are written back as the original bytes.
+                            $srcBytes = [System.IO.File]::ReadAllBytes($srcPath)
+                            $bomLength = if ($srcBytes.Length -ge 3 -and $srcBytes[0] -eq 0xEF -and $srcBytes[1] -eq 0xBB -and $srcBytes[2] -eq 0xBF) { 3 } else { 0 }
+                            $content = [System.Text.Encoding]::UTF8.GetString($srcBytes, $bomLength, $srcBytes.Length - $bomLength)
+
+                            if ($placeholderRegex.IsMatch($content)) {
+                                $content = $placeholderRegex.Replace($content, $placeholderEvaluator)
                                 [System.IO.File]::WriteAllText($destPath, $content, [System.Text.UTF8Encoding]::new($false))
                                 Write-Status "Injected placeholders into: $($destFile.Name)" -Type Detail
                             }
+                            else {
+                                [System.IO.File]::WriteAllBytes($destPath, $srcBytes)
+                            }
+                        }
+                        else {
+                            # Plain File.Copy: no provider pipeline or item output for a single small file
+                            [System.IO.File]::Copy($srcFullPath, $destPath, $true)
                         }
 
                         Write-Status "Copied: $($destFile.Name)" -Type Detail
@@ -4854,26 +5546,66 @@ function Initialize-PatchedExtensions {
 
             # Apply file patches (regex replacements on existing extension files)
             if ($config.PSObject.Properties['file_patches']) {
+                # Walk the extension tree once and match every glob against that listing,
+                # instead of one recursive Get-ChildItem per file_patches entry. Globs with
+                # directory parts ("spa/assets/ask-input-*.js") are matched against the same
+                # number of trailing path segments, as -Filter did at each recursion level.
+                $separators = [char[]]@('\', '/')
+                $extRoot = New-Object System.IO.DirectoryInfo $extOutputDir
+                $extRootLength = $extRoot.FullName.TrimEnd($separators).Length + 1
+                $extFiles = [System.Collections.Generic.List[hashtable]]::new()
+                foreach ($fileInfo in $extRoot.EnumerateFiles('*', [System.IO.SearchOption]::AllDirectories)) {
+                    $extFiles.Add(@{
+                        File     = $fileInfo
+                        Segments = $fileInfo.FullName.Substring($extRootLength).Split($separators)
+                    })
+                }
+
                 foreach ($filePattern in $config.file_patches.PSObject.Properties) {
                     if ($filePattern.Name -eq '_comment') { continue }
 
                     # Find files matching the glob pattern
-                    $matchingFiles = Get-ChildItem -Path $extOutputDir -Filter $filePattern.Name -Recurse -File -ErrorAction SilentlyContinue
+                    $globSegments = $filePattern.Name.Split($separators)
+                    $glob = [System.Management.Automation.WildcardPattern]::new(($globSegments -join '/'), [System.Management.Automation.WildcardOptions]::IgnoreCase)
+                    $matchingFiles = [System.Collections.Generic.List[System.IO.FileInfo]]::new()
+                    foreach ($entry in $extFiles) {
+                        $segments = $entry.Segments
+                        if ($segments.Length -lt $globSegments.Length) { continue }
+                        $tail = [string]::Join('/', $segments, $segments.Length - $globSegments.Length, $globSegments.Length)
+                        if ($glob.IsMatch($tail)) {
+                            $matchingFiles.Add($entry.File)
+                        }
+                    }
+
+                    # Per patch: the literal prefix (checked with IndexOf before the regex runs) and
+                    # the regex itself, parsed once per glob rather than once per file.
+                    # IgnoreCase matches the -match / -replace operator semantics.
+                    $patches = @($filePattern.Value)
+                    $patchProbes = @(foreach ($patch in $patches) { Get-RegexLiteralPrefix -Pattern $patch.pattern })
+                    $patchRegexes = @(foreach ($patch in $patches) { [regex]::new($patch.pattern, [System.Text.RegularExpressions.RegexOptions]::IgnoreCase) })
 
                     foreach ($file in $matchingFiles) {
-                        $content = Get-Content -Path $file.FullName -Raw -Encoding UTF8
+                        $content = [System.IO.File]::ReadAllText($file.FullName, [System.Text.Encoding]::UTF8)
+                        $originalContent = $content
                         $modified = $false
 
-                        foreach ($patch in $filePattern.Value) {
-                            # Use regex pattern directly (not escaped) for flexible matching
-                            if ($content -match $patch.pattern) {
-                                $content = $content -replace $patch.pattern, $patch.replacement
+                        for ($p = 0; $p -lt $patches.Count; $p++) {
+                            $patch = $patches[$p]
+                            $probe = $patchProbes[$p]
+                            if ($probe.Length -gt 0 -and $content.IndexOf($probe, [System.StringComparison]::OrdinalIgnoreCase) -lt 0) { continue }
+
+                            # Use regex pattern directly (not escaped) for flexible matching.
+                            # Replace resumes from the first match, so each patch scans the file once.
+                            $firstMatch = $patchRegexes[$p].Match($content)
+                            if ($firstMatch.Success) {
+                                $content = $patchRegexes[$p].Replace($content, $patch.replacement, -1, $firstMatch.Index)
                                 $modified = $true
                                 Write-VerboseTimestamped "[File Patch] Applied: $($patch.description)"
                             }
                         }
 
-                        if ($modified) {
+                        # Skip the write when the replacements were no-ops
+                        if ($modified -and -not [string]::Equals($content, $originalContent)) {
                             [System.IO.File]::WriteAllText($file.FullName, $content, [System.Text.UTF8Encoding]::new($false))
                             Write-Status "Patched: $($file.Name)" -Type Detail
                         }
@@ -4887,6 +5619,10 @@ function Initialize-PatchedExtensions {
                 if (Test-Path $manifestPath) {
                     $manifest = Get-JsonFile -Path $manifestPath
 
+                    if ($manifestKey) {
+                        $manifest | Add-Member -NotePropertyName "key" -NotePropertyValue $manifestKey -Force
+                    }
+
                     # Add declarative_net_request
                     if ($config.manifest_additions.PSObject.Properties['declarative_net_request']) {
                         if (-not $manifest.PSObject.Properties['declarative_net_request']) {
@@ -4943,9 +5679,16 @@ function Initialize-PatchedExtensions {
             # Modify service-worker-loader.js
             if ($config.PSObject.Properties['service_worker_import']) {
                 $loaderPath = Join-Path $extOutputDir "service-worker-loader.js"
-                if (Test-Path $loaderPath) {
-                    $content = Get-Content -Path $loaderPath -Raw -Encoding UTF8
+                # Open directly rather than Test-Path + read; a missing loader is simply skipped
+                $content = $null
+                try {
+                    $content = [System.IO.File]::ReadAllText($loaderPath, [System.Text.Encoding]::UTF8)
+                }
+                catch [System.IO.FileNotFoundException] {
+                    Write-VerboseTimestamped "[Patch] service-worker-loader.js not present in $extName"
+                }
 
+                if ($null -ne $content) {
                     if ($content -notmatch [regex]::Escape($config.service_worker_import)) {
                         $modified = "import './$($config.service_worker_import)';  // Meteor preference enforcement`n$content"
                         Set-Content -Path $loaderPath -Value $modified -Encoding UTF8 -NoNewline
@@ -5079,57 +5822,84 @@ function Initialize-PakModifications {
     }
     $totalPatterns = $unmatchedPatterns.Count
 
+    # Compile each modification pattern once instead of re-parsing it for every resource.
+    # IgnoreCase keeps the case-insensitive semantics of PowerShell's -match / -replace.
+    # The context regex only feeds verbose logging, so it is not worth compiling to IL.
+    $regexOptions = [System.Text.RegularExpressions.RegexOptions]::IgnoreCase -bor [System.Text.RegularExpressions.RegexOptions]::Compiled
+    $compiledMods = [System.Collections.Generic.List[hashtable]]::new()
+    foreach ($mod in $PakConfig.modifications) {
+        $compiledMods.Add(@{
+            Mod          = $mod
+            Probe        = Get-RegexLiteralPrefix -Pattern $mod.pattern
+            Regex        = [regex]::new($mod.pattern, $regexOptions)
+            ContextRegex = [regex]::new("(.{0,100})($([regex]::Escape($mod.pattern)))(.{0,100})", [System.Text.RegularExpressions.RegexOptions]::IgnoreCase)
+        })
+    }
+
     # Iterate through all resources (skip sentinel at end)
+    $rawBytes = $pak.RawBytes
     for ($i = 0; $i -lt $pak.Resources.Count - 1; $i++) {
         $resource = $pak.Resources[$i]
         $resourceId = $resource.Id
 
-        # Get resource bytes (comma operator in return preserves byte[] type)
-        $resourceBytes = Get-PakResource -Pak $pak -ResourceId $resourceId
-        if ($null -eq $resourceBytes) { continue }
-
-        # Ensure we have a byte[] and get its length safely
-        [byte[]]$resourceBytes = $resourceBytes
-        $byteLength = $resourceBytes.Length
+        # Work on the resource in place within RawBytes; slicing each one out with
+        # Get-PakResource copied every resource in the file just to look at it
+        $startOffset = $resource.Offset
+        $byteLength = $pak.Resources[$i + 1].Offset - $startOffset
         if ($byteLength -lt 2) { continue }
 
         $scannedCount++
 
         # Check if gzip compressed (magic bytes: 0x1f 0x8b)
-        $isGzipped = ($resourceBytes[0] -eq 0x1f -and $resourceBytes[1] -eq 0x8b)
-        $contentBytes = $resourceBytes
+        $isGzipped = ($rawBytes[$startOffset] -eq 0x1f -and $rawBytes[$startOffset + 1] -eq 0x8b)
 
         if ($isGzipped) {
             $gzipCount++
-            $decompressed = Expand-GzipData -CompressedBytes $resourceBytes
-            if ($null -eq $decompressed) { continue }
-            $contentBytes = $decompressed
-        }
+            $contentBytes = Expand-GzipData -CompressedBytes $rawBytes -Offset $startOffset -Count $byteLength
+            if ($null -eq $contentBytes) { continue }
 
-        # Skip binary resources
-        if (Test-BinaryContent -Bytes $contentBytes) { continue }
-        $content = [System.Text.Encoding]::UTF8.GetString($contentBytes)
+            # Skip binary resources
+            if (Test-BinaryContent -Bytes $contentBytes) { continue }
+            $content = [System.Text.Encoding]::UTF8.GetString($contentBytes)
+        }
+        else {
+            if (Test-BinaryContent -Bytes $rawBytes -Offset $startOffset -Count $byteLength) { continue }
+            $content = [System.Text.Encoding]::UTF8.GetString($rawBytes, $startOffset, $byteLength)
+        }
 
         $textCount++
         $resourceModified = $false
+        $originalContent = $content
 
         # Try each modification pattern
-        $modIndex = 0
-        foreach ($mod in $PakConfig.modifications) {
-            if ($content -match $mod.pattern) {
+        for ($modIndex = 0; $modIndex -lt $compiledMods.Count; $modIndex++) {
+            $compiled = $compiledMods[$modIndex]
+            $mod = $compiled.Mod
+            # Most resources cannot match; a literal IndexOf rules them out before the regex runs
+            if ($compiled.Probe.Length -gt 0 -and $content.IndexOf($compiled.Probe, [System.StringComparison]::OrdinalIgnoreCase) -lt 0) { continue }
+            $firstMatch = $compiled.Regex.Match($content)
+            if ($firstMatch.Success) {
                 # Show context around the match for debugging
-                if ($content -match "(.{0,100})($([regex]::Escape($mod.pattern)))(.{0,100})") {
-                    $context = "$($Matches[1])>>>$($Matches[2])<<<$($Matches[3])" -replace '[\r\n]+', ' '
+                $contextMatch = $compiled.ContextRegex.Match($content)
+                if ($contextMatch.Success) {
+                    $context = "$($contextMatch.Groups[1].Value)>>>$($contextMatch.Groups[2].Value)<<<$($contextMatch.Groups[3].Value)" -replace '[\r\n]+', ' '
                     Write-VerboseTimestamped "[PAK] Match context in $resourceId`: $context"
                 }
-                $content = $content -replace $mod.pattern, $mod.replacement
+                # Resume from the first match instead of rescanning the text before it
+                $content = $compiled.Regex.Replace($content, $mod.replacement, -1, $firstMatch.Index)
                 Write-Status "  Resource $resourceId - $($mod.description)" -Type Detail
                 $resourceModified = $true
                 $appliedCount++
                 # Mark this pattern as matched for early exit
                 [void]$unmatchedPatterns.Remove($modIndex)
             }
-            $modIndex++
+        }
+
+        # A match whose replacement leaves the text as it was (e.g. already patched)
+        # must not force a re-encode, recompress and PAK rewrite
+        if ($resourceModified -and [string]::Equals($content, $originalContent)) {
+            Write-VerboseTimestamped "[PAK] Resource $resourceId unchanged after replacement - not rewriting"
+            $resourceModified = $false
         }
 
         # Track modified resources (with compression flag)
@@ -5241,29 +6011,27 @@ function Initialize-PakModifications {
                 Write-VerboseTimestamped "[PAK] File modified successfully (hash changed)"
 
                 # Re-read and verify one of our modifications (resource 21192 - shouldHide)
-                $verifyPak = Read-PakFile -Path $pakPath
-                if ($verifyPak) {
-                    $verifyBytes = Get-PakResource -Pak $verifyPak -ResourceId 21192
-                    if ($verifyBytes) {
-                        [byte[]]$verifyBytes = $verifyBytes
-                        # Decompress if gzipped
-                        if ($verifyBytes[0] -eq 0x1f -and $verifyBytes[1] -eq 0x8b) {
-                            $decompressed = Expand-GzipData -CompressedBytes $verifyBytes
-                            if ($null -ne $decompressed) {
-                                $verifyBytes = $decompressed
-                            }
-                        }
-                        $verifyContent = [System.Text.Encoding]::UTF8.GetString($verifyBytes)
-                        if ($verifyContent -match 'return false;\s*//\s*Meteor|shouldHidePerplexityServiceWorker.*return false;') {
-                            Write-VerboseTimestamped "[PAK] Verification: inspect modification confirmed in written file"
-                        }
-                        elseif ($verifyContent -notmatch 'return !isPerplexityInternalUser') {
-                            Write-VerboseTimestamped "[PAK] Verification: original pattern NOT found (modification likely applied)"
-                        }
-                        else {
-                            Write-Status "PAK verification failed: original pattern still present in resource 21192" -Type Warning
+                # Only the entry table and that one resource are read back, not the whole PAK
+                $verifyBytes = Get-PakResourceFromFile -Path $pakPath -ResourceId 21192
+                if ($verifyBytes) {
+                    [byte[]]$verifyBytes = $verifyBytes
+                    # Decompress if gzipped
+                    if ($verifyBytes[0] -eq 0x1f -and $verifyBytes[1] -eq 0x8b) {
+                        $decompressed = Expand-GzipData -CompressedBytes $verifyBytes
+                        if ($null -ne $decompressed) {
+                            $verifyBytes = $decompressed
                         }
                     }
+                    $verifyContent = [System.Text.Encoding]::UTF8.GetString($verifyBytes)
+                    if ($verifyContent -match 'return false;\s*//\s*Meteor|shouldHidePerplexityServiceWorker.*return false;') {
+                        Write-VerboseTimestamped "[PAK] Verification: inspect modification confirmed in written file"
+                    }
+                    elseif ($verifyContent -notmatch 'return !isPerplexityInternalUser') {
+                        Write-VerboseTimestamped "[PAK] Verification: original pattern NOT found (modification likely applied)"
+                    }
+                    else {
+                        Write-Status "PAK verification failed: original pattern still present in resource 21192" -Type Warning
+                    }
                 }
             }
         }
@@ -5438,8 +6206,8 @@ function Get-HmacSeedFromLocalState {
     # Try to read existing Local State
     if (Test-Path $LocalStatePath) {
         try {
-            $json = Get-Content -Path $LocalStatePath -Raw -ErrorAction Stop
-            $localState = $json | ConvertFrom-Json -ErrorAction Stop
+            $json = Get-TextFile -Path $LocalStatePath
+            $localState = ConvertFrom-Json -InputObject $json -ErrorAction Stop
 
             # Check for existing seed
             if ($localState.protection -and $localState.protection.seed) {
@@ -5646,23 +6414,17 @@ function ConvertTo-ChromiumJson {
         return $Json
     }
 
-    # Step 1: Convert all lowercase unicode escapes to uppercase
-    # Pattern: \uXXXX where XXXX is hex (case-insensitive match, replace with uppercase)
-    $result = [regex]::Replace($Json, '\\u([0-9a-fA-F]{4})', {
-        param($match)
-        "\u" + $match.Groups[1].Value.ToUpper()
-    })
-
-    # Step 2: Unescape > (Chromium doesn't escape it)
-    # \u003E -> >
-    $result = $result -replace '\\u003E', '>'
-
-    # Step 3: Unescape single quotes (Chromium doesn't escape them)
-    # \u0027 -> '
-    # PowerShell escapes ' as \u0027, but Chromium writes literal '
-    $result = $result -replace '\\u0027', "'"
+    # Most values contain no escapes at all; skip the regex entirely for those
+    if ($Json.IndexOf('\u', [System.StringComparison]::Ordinal) -lt 0) {
+        return $Json
+    }
 
-    return $result
+    # Steps 1-3 in a single pass over the precompiled pattern:
+    # 1. Convert all lowercase unicode escapes to uppercase (\u003c -> \u003C)
+    # 2. Unescape > (Chromium doesn't escape it): \u003E -> >
+    # 3. Unescape single quotes: \u0027 -> '
+    #    PowerShell escapes ' as \u0027, but Chromium writes literal '
+    return $script:UnicodeEscapeRegex.Replace($Json, $script:UnicodeEscapeEvaluator)
 }
 
 function ConvertTo-JsonForHmac {
@@ -5854,7 +6616,8 @@ function Set-RegistryPreferenceMacs {
         [hashtable]$PreferencesToSet
     )
 
-    $regPath = "HKCU:\SOFTWARE\Perplexity\Comet\PreferenceMACs\Default"
+    $regSubKey = "SOFTWARE\Perplexity\Comet\PreferenceMACs\Default"
+    $regPath = "HKCU:\$regSubKey"
 
     # Known split prefixes - these use hierarchical subkey structure
     # Determined by Chromium's pref_hash_filter.cc tracked split preferences
@@ -5893,11 +6656,16 @@ function Set-RegistryPreferenceMacs {
         return $true
     }
 
+    # Hold one handle on the Default key (and one per split subkey) for all writes,
+    # instead of re-resolving the full HKCU path through the provider for every value
+    $rootKey = $null
+    $splitKeys = @{}
+
     try {
-        # Create the registry path if it doesn't exist
-        if (-not (Test-Path $regPath)) {
-            New-Item -Path $regPath -Force | Out-Null
-            Write-VerboseTimestamped "[Registry MAC] Created path: $regPath"
+        # Opens the key, creating it (and any missing parents) if needed
+        $rootKey = [Microsoft.Win32.Registry]::CurrentUser.CreateSubKey($regSubKey)
+        if (-not $rootKey) {
+            throw "Unable to open or create $regPath"
         }
 
         foreach ($path in $PreferencesToSet.Keys) {
@@ -5911,17 +6679,16 @@ function Set-RegistryPreferenceMacs {
             if ($splitInfo.IsSplit) {
                 # Split MAC: Write to subkey structure
                 # e.g., extensions.settings.xxx -> Default\extensions.settings\xxx
-                $subkeyPath = Join-Path $regPath $splitInfo.Prefix
-                if (-not (Test-Path $subkeyPath)) {
-                    New-Item -Path $subkeyPath -Force | Out-Null
-                    Write-VerboseTimestamped "[Registry MAC] Created subkey: $subkeyPath"
+                if (-not $splitKeys.ContainsKey($splitInfo.Prefix)) {
+                    # Opened relative to the already-open Default key
+                    $splitKeys[$splitInfo.Prefix] = $rootKey.CreateSubKey($splitInfo.Prefix)
                 }
-                Set-ItemProperty -Path $subkeyPath -Name $splitInfo.Suffix -Value $mac -Type String -Force
+                $splitKeys[$splitInfo.Prefix].SetValue($splitInfo.Suffix, $mac, [Microsoft.Win32.RegistryValueKind]::String)
                 Write-VerboseTimestamped "[Registry MAC] Set (split) $($splitInfo.Prefix)\$($splitInfo.Suffix) = $($mac.Substring(0, 16))..."
             }
             else {
                 # Atomic MAC: Write directly to Default key
-                Set-ItemProperty -Path $regPath -Name $path -Value $mac -Type String -Force
+                $rootKey.SetValue($path, $mac, [Microsoft.Win32.RegistryValueKind]::String)
                 Write-VerboseTimestamped "[Registry MAC] Set (atomic) $path = $($mac.Substring(0, 16))..."
             }
         }
@@ -5933,6 +6700,12 @@ function Set-RegistryPreferenceMacs {
         Write-VerboseTimestamped "[Registry MAC] Error setting registry MACs: $_"
         return $false
     }
+    finally {
+        foreach ($key in $splitKeys.Values) {
+            if ($key) { $key.Dispose() }
+        }
+        if ($rootKey) { $rootKey.Dispose() }
+    }
 }
 
 function Get-SuperMac {
@@ -6368,15 +7141,15 @@ function Update-TrackedPreferences {
         Write-VerboseTimestamped "[Secure Prefs] Reading Local State from: $LocalStatePath"
         Write-VerboseTimestamped "[Secure Prefs] Reading Secure Prefs from: $SecurePrefsPath"
 
-        $localStateJson = Get-Content -Path $LocalStatePath -Raw -ErrorAction Stop
-        $localState = $localStateJson | ConvertFrom-Json -ErrorAction Stop
+        $localStateJson = Get-TextFile -Path $LocalStatePath
+        $localState = ConvertFrom-Json -InputObject $localStateJson -ErrorAction Stop
 
         # Debug: Show Local State structure
         $localStateKeys = $localState.PSObject.Properties.Name -join ", "
         Write-VerboseTimestamped "[Secure Prefs] Local State keys: $localStateKeys"
 
-        $securePrefsJson = Get-Content -Path $SecurePrefsPath -Raw -ErrorAction Stop
-        $securePrefs = $securePrefsJson | ConvertFrom-Json -ErrorAction Stop
+        $securePrefsJson = Get-TextFile -Path $SecurePrefsPath
+        $securePrefs = ConvertFrom-Json -InputObject $securePrefsJson -ErrorAction Stop
 
         # Also load regular Preferences file - many tracked prefs are stored here
         # (session.*, homepage, google.services.*, etc.)
@@ -6384,9 +7157,9 @@ function Update-TrackedPreferences {
         $regularPrefsHash = $null
         if (Test-Path $regularPrefsPath) {
             Write-VerboseTimestamped "[Secure Prefs] Reading Regular Prefs from: $regularPrefsPath"
-            $regularPrefsJson = Get-Content -Path $regularPrefsPath -Raw -ErrorAction SilentlyContinue
+            $regularPrefsJson = try { Get-TextFile -Path $regularPrefsPath } catch { $null }
             if ($regularPrefsJson) {
-                $regularPrefs = $regularPrefsJson | ConvertFrom-Json -ErrorAction SilentlyContinue
+                $regularPrefs = ConvertFrom-Json -InputObject $regularPrefsJson -ErrorAction SilentlyContinue
                 if ($regularPrefs) {
                     $regularPrefsHash = Convert-PSObjectToHashtable -InputObject $regularPrefs
                     Write-VerboseTimestamped "[Secure Prefs] Regular Prefs loaded ($($regularPrefsHash.Keys.Count) top-level keys)"
@@ -6440,7 +7213,7 @@ function Update-TrackedPreferences {
         Write-VerboseTimestamped "[Secure Prefs] Original securePrefs type: $($securePrefs.GetType().FullName)"
         $origProps = $securePrefs.PSObject.Properties.Name -join ", "
         Write-VerboseTimestamped "[Secure Prefs] Original securePrefs properties: $origProps"
-        if ($securePrefs.PSObject.Properties.Name -contains 'protection') {
+        if ($securePrefs.PSObject.Properties['protection']) {
             Write-VerboseTimestamped "[Secure Prefs] Original HAS 'protection' property!"
         } else {
             Write-VerboseTimestamped "[Secure Prefs] Original MISSING 'protection' property!"
@@ -6832,9 +7605,10 @@ function Update-TrackedPreferences {
             if ($lookupResult.Found) {
                 $value = $lookupResult.Value
                 # WORKAROUND: PowerShell 5.1 converts [] to $null
-                # Check if raw JSON had [] for this path (detected during Update-AllMacs)
-                # We can check by looking for "path":[] pattern in the raw JSON
-                if ($null -eq $value -and $securePrefsJson -match ('"' + [regex]::Escape($path) + '"\s*:\s*\[\s*\]')) {
+                # Check if raw JSON had [] for this path. Update-AllMacs already swept the raw
+                # JSON once for every "key":[] pair, so reuse that set instead of re-scanning
+                # the whole file per path.
+                if ($null -eq $value -and $updateResult.emptyArrayPaths -and $updateResult.emptyArrayPaths.ContainsKey($path)) {
                     $value = @()
                 }
                 $registryPrefs[$path] = $value
@@ -7531,8 +8305,8 @@ function Write-LocalState {
         $localState = $null
         if (Test-Path $LocalStatePath) {
             try {
-                $existingJson = Get-Content -Path $LocalStatePath -Raw -ErrorAction Stop
-                $existingState = $existingJson | ConvertFrom-Json -ErrorAction Stop
+                $existingJson = Get-TextFile -Path $LocalStatePath
+                $existingState = ConvertFrom-Json -InputObject $existingJson -ErrorAction Stop
                 $localState = Convert-PSObjectToHashtable -InputObject $existingState
                 Write-VerboseTimestamped "[Local State] Read existing Local State, preserving os_crypt and other keys"
             }
@@ -7618,7 +8392,7 @@ function Update-LocalStateExperiments {
 
         # Read existing Local State if it exists
         if (Test-Path $LocalStatePath) {
-            $localStateJson = Get-Content -Path $LocalStatePath -Raw -ErrorAction Stop
+            $localStateJson = Get-TextFile -Path $LocalStatePath
 
             # PS 5.1 workaround: Check for empty arrays in raw JSON before parsing
             $hasEmptyExperiments = $localStateJson -match '"enabled_labs_experiments"\s*:\s*\[\s*\]'
@@ -7736,10 +8510,17 @@ function Test-FeatureConflicts {
         return $false
     }
 
-    # Find features that appear in both lists
-    $conflicts = $EnableFeatures | Where-Object { $DisableFeatures -contains $_ }
+    # Find features that appear in both lists (hash lookup instead of -contains per item;
+    # case-insensitive to match the previous -contains semantics)
+    $disableSet = [System.Collections.Generic.HashSet[string]]::new($DisableFeatures, [System.StringComparer]::OrdinalIgnoreCase)
+    $conflicts = [System.Collections.Generic.List[string]]::new()
+    foreach ($feature in $EnableFeatures) {
+        if ($disableSet.Contains($feature)) {
+            $conflicts.Add($feature)
+        }
+    }
 
-    if ($conflicts -and $conflicts.Count -gt 0) {
+    if ($conflicts.Count -gt 0) {
         Write-Status "Feature flag conflicts detected!" -Type Warning
         foreach ($conflict in $conflicts) {
             Write-Status "  Conflict: '$conflict' is in both enable and disable lists" -Type Warning
@@ -8351,8 +9132,7 @@ function Test-SetupRequired {
         if ($defaultAppsDir) {
             # Check both active CRX files and backed-up CRX files
             # Exclude comet_web_resources.crx - it's loaded directly via external_extensions.json (no patching)
-            $allCrx = Get-ChildItem -Path $defaultAppsDir -Filter "*.crx*" -ErrorAction SilentlyContinue | Where-Object {
-                ($_.Extension -eq '.crx' -or $_.Name.EndsWith('.crx.meteor-backup')) -and
+            $allCrx = (Get-DefaultAppsCrxFiles -DefaultAppsDir $defaultAppsDir) | Where-Object {
                 $_.Name -notlike 'comet_web_resources.crx*'
             }
             foreach ($crx in $allCrx) {
@@ -8453,11 +9233,18 @@ function Initialize-Extensions {
             }
 
             # Backup other .crx files (not comet_web_resources - it stays in place)
-            $crxFilesToBackup = Get-ChildItem -Path $defaultAppsDir -Filter "*.crx" -ErrorAction SilentlyContinue |
-                Where-Object { $_.Name -ne "comet_web_resources.crx" }
+            # One listing of default_apps answers both which CRXs exist and which are already
+            # backed up, instead of a Test-Path per CRX for its .meteor-backup sibling
+            $crxListing = @(Get-DefaultAppsCrxFiles -DefaultAppsDir $defaultAppsDir)
+            $listedNames = [System.Collections.Generic.HashSet[string]]::new([System.StringComparer]::OrdinalIgnoreCase)
+            foreach ($entry in $crxListing) {
+                [void]$listedNames.Add($entry.Name)
+            }
+
+            $crxFilesToBackup = $crxListing | Where-Object { $_.Extension -eq '.crx' -and $_.Name -ne "comet_web_resources.crx" }
             foreach ($crx in $crxFilesToBackup) {
                 $backupPath = "$($crx.FullName).meteor-backup"
-                if (-not (Test-Path $backupPath)) {
+                if (-not $listedNames.Contains("$($crx.Name).meteor-backup")) {
                     if ($WhatIfPreference) {
                         Write-Status "Would backup: $($crx.Name)" -Type Detail
                     }
@@ -8500,8 +9287,8 @@ function Initialize-Extensions {
     if (-not $WhatIfPreference) {
         $defaultAppsDir = Get-DefaultAppsDirectory -CometDir $Comet.Directory
         if ($defaultAppsDir) {
-            Get-ChildItem -Path $defaultAppsDir -Filter "*.crx*" -ErrorAction SilentlyContinue | Where-Object { $_.Extension -eq '.crx' -or $_.Name.EndsWith('.crx.meteor-backup') } | ForEach-Object {
-                Update-FileHash -FilePath $_.FullName -State $State
+            foreach ($crxFile in (Get-DefaultAppsCrxFiles -DefaultAppsDir $defaultAppsDir)) {
+                Update-FileHash -FilePath $crxFile.FullName -State $State
             }
         }
     }
@@ -8881,9 +9668,6 @@ function Main {
         Join-Path $baseDir ".meteor"
     }
 
-    # Ensure data directory exists
-    New-DirectoryIfNotExists -Path $meteorDataPath
-
     # User data path for browser profile (inside meteorDataPath)
     $userDataPath = Join-Path $meteorDataPath "User Data"
 
@@ -8914,6 +9698,9 @@ function Main {
         }
     }
 
+    # Ensure data directory exists (deferred past -VerifyPak, which never touches it)
+    New-DirectoryIfNotExists -Path $meteorDataPath
+
     # Resolve paths
     $patchedExtPath = Resolve-MeteorPath -BasePath $baseDir -RelativePath $config.paths.patched_extensions
     $ublockPath = Resolve-MeteorPath -BasePath $baseDir -RelativePath $config.paths.ublock
@@ -8925,6 +9712,12 @@ function Main {
     # Load state
     $state = Get-MeteorState -StatePath $statePath
 
+    # Kept-alive HTTP connections are pooled per host for the whole process, runspaces
+    # included. The default limit of 2 per host makes the 4-way parallel update checks
+    # and CRX downloads (all against clients2.google.com) queue behind each other;
+    # raise it so each worker keeps its own pooled connection.
+    [Net.ServicePointManager]::DefaultConnectionLimit = [Math]::Max([Net.ServicePointManager]::DefaultConnectionLimit, 8)
+
     if ($WhatIfPreference) {
         Write-Status "DRY RUN MODE - No changes will be made" -Type Warning
         Write-Host ""
@@ -9235,15 +10028,14 @@ function Main {
 
                     # Find key matching CRX ID
                     if ($crxId -and $keys.Count -gt 0) {
-                        $crxIdHex = [BitConverter]::ToString($crxId).Replace("-", "").ToLower()
-                        foreach ($key in $keys) {
-                            $sha = [System.Security.Cryptography.SHA256]::Create()
-                            try {
+                        $crxIdHex = [BitConverter]::ToString($crxId)
+                        $sha = [System.Security.Cryptography.SHA256]::Create()
+                        try {
+                            foreach ($key in $keys) {
                                 $hash = $sha.ComputeHash($key)
-                                $hashHex = [BitConverter]::ToString($hash[0..15]).Replace("-", "").ToLower()
-                                if ($hashHex -eq $crxIdHex) { return [Convert]::ToBase64String($key) }
-                            } finally { $sha.Dispose() }
-                        }
+                                if ([BitConverter]::ToString($hash, 0, 16) -eq $crxIdHex) { return [Convert]::ToBase64String($key) }
+                            }
+                        } finally { $sha.Dispose() }
                     }
                     if ($keys.Count -gt 0) { return [Convert]::ToBase64String($keys[0]) }
                     return $null
@@ -9278,37 +10070,39 @@ function Main {
                 # Extract public key before extracting ZIP
                 $publicKey = Get-InlineCrxPublicKey -Bytes $bytes
 
-                $zipOffset = Get-InlineCrxZipOffset -Bytes $bytes
+                $zipOffset = [int](Get-InlineCrxZipOffset -Bytes $bytes)
                 $zipLength = $bytes.Length - $zipOffset
-                $zipBytes = New-Object byte[] $zipLength
-                [Array]::Copy($bytes, $zipOffset, $zipBytes, 0, $zipLength)
 
                 # Validate ZIP magic
-                if ($zipBytes.Length -lt 4 -or $zipBytes[0] -ne 0x50 -or $zipBytes[1] -ne 0x4B) {
+                if ($zipLength -lt 4 -or $bytes[$zipOffset] -ne 0x50 -or $bytes[$zipOffset + 1] -ne 0x4B) {
                     throw "Invalid ZIP magic in CRX"
                 }
 
-                # Write to temp file and extract using .NET
-                $tempZip = Join-Path $env:TEMP "meteor_adblock_$(Get-Random).zip"
+                # Read entries straight out of the CRX buffer: no copy of the ZIP portion,
+                # no temp .zip written and read back, one pass over the archive
+                if (Test-Path $OutputDir) { Remove-Item -Path $OutputDir -Recurse -Force }
+                New-Item -Path $OutputDir -ItemType Directory -Force | Out-Null
+                Add-Type -AssemblyName System.IO.Compression, System.IO.Compression.FileSystem
+                $zipStream = [System.IO.MemoryStream]::new($bytes, $zipOffset, $zipLength, $false)
+                $archive = [System.IO.Compression.ZipArchive]::new($zipStream, [System.IO.Compression.ZipArchiveMode]::Read)
                 try {
-                    [System.IO.File]::WriteAllBytes($tempZip, $zipBytes)
-                    if (Test-Path $OutputDir) { Remove-Item -Path $OutputDir -Recurse -Force }
-                    New-Item -Path $OutputDir -ItemType Directory -Force | Out-Null
-                    Add-Type -AssemblyName System.IO.Compression.FileSystem
-                    [System.IO.Compression.ZipFile]::ExtractToDirectory($tempZip, $OutputDir)
+                    [System.IO.Compression.ZipFileExtensions]::ExtractToDirectory($archive, $OutputDir)
                 }
                 finally {
-                    if (Test-Path $tempZip) { Remove-Item -Path $tempZip -Force }
+                    $archive.Dispose()
+                    $zipStream.Dispose()
                 }
 
                 # Inject public key into manifest.json
                 if ($publicKey) {
                     $manifestPath = Join-Path $OutputDir "manifest.json"
-                    if (Test-Path $manifestPath) {
-                        $manifestContent = Get-Content -Path $manifestPath -Raw -Encoding UTF8
-                        $manifest = $manifestContent | ConvertFrom-Json
+                    if ([System.IO.File]::Exists($manifestPath)) {
+                        # ReadAllText + -InputObject: no provider pipeline, parsed in one call
+                        $manifestContent = [System.IO.File]::ReadAllText($manifestPath, [System.Text.Encoding]::UTF8)
+                        $manifest = ConvertFrom-Json -InputObject $manifestContent
                         $manifest | Add-Member -NotePropertyName "key" -NotePropertyValue $publicKey -Force
-                        $manifest | ConvertTo-Json -Depth 20 | Set-Content -Path $manifestPath -Encoding UTF8
+                        $manifestJson = ConvertTo-Json -InputObject $manifest -Depth 20
+                        [System.IO.File]::WriteAllText($manifestPath, $manifestJson + [Environment]::NewLine, [System.Text.Encoding]::UTF8)
                     }
                 }
                 return $true
@@ -9402,7 +10196,8 @@ setTimeout(checkAndImport, 3000);
 
                 # Save settings JSON
                 $settingsPath = Join-Path $UBlockDir "ublock-settings.json"
-                $Defaults | ConvertTo-Json -Depth 20 | Set-Content -Path $settingsPath -Encoding UTF8
+                $settingsJson = ConvertTo-Json -InputObject $Defaults -Depth 20
+                [System.IO.File]::WriteAllText($settingsPath, $settingsJson + [Environment]::NewLine, [System.Text.Encoding]::UTF8)
             }
 
             $result = @{ UBlockPath = $null; AdGuardPath = $null; Success = $true; Error = $null }
@@ -30,6 +30,19 @@
 $script:FileMacSeed = ""  # Comet uses empty string
 $script:RegistryMacSeed = "ChromeRegistryHashStoreValidationSeed"
 
+# Precompiled patterns - built once when this file is dot-sourced instead of on every call
+$script:UnicodeEscapeRegex = [regex]::new('\\u([0-9a-fA-F]{4})', [System.Text.RegularExpressions.RegexOptions]::Compiled)
+$script:UnicodeEscapeEvaluator = [System.Text.RegularExpressions.MatchEvaluator]{
+    param($match)
+    $hex = $match.Groups[1].Value.ToUpperInvariant()
+    switch ($hex) {
+        '003E' { '>' }
+        '0027' { "'" }
+        default { "\u$hex" }
+    }
+}
+$script:EmptyArrayKeyRegex = [regex]::new('"((?:[^"\\]|\\.)*)"\s*:\s*\[\s*\]', [System.Text.RegularExpressions.RegexOptions]::Compiled)
+
 # ============================================================================
 # DEVICE ID
 # ============================================================================
@@ -108,10 +121,16 @@ function Get-HmacSha256 {
     $messageBytes = [System.Text.Encoding]::UTF8.GetBytes($Message)
 
     $hmac = New-Object System.Security.Cryptography.HMACSHA256
-    $hmac.Key = $keyBytes
-    $hashBytes = $hmac.ComputeHash($messageBytes)
+    try {
+        $hmac.Key = $keyBytes
+        $hashBytes = $hmac.ComputeHash($messageBytes)
+    }
+    finally {
+        $hmac.Dispose()
+    }
 
-    return ($hashBytes | ForEach-Object { $_.ToString("X2") }) -join ""
+    # BitConverter emits uppercase hex directly - no per-byte pipeline or joined list
+    return [BitConverter]::ToString($hashBytes).Replace("-", "")
 }
 
 # ============================================================================
@@ -252,19 +271,11 @@ function ConvertTo-ChromiumJson {
         return $Json
     }
 
-    # Step 1: Convert all lowercase unicode escapes to uppercase
-    $result = [regex]::Replace($Json, '\\u([0-9a-fA-F]{4})', {
-        param($match)
-        "\u" + $match.Groups[1].Value.ToUpper()
-    })
-
-    # Step 2: Unescape > (Chromium doesn't escape it)
-    $result = $result -replace '\\u003E', '>'
-
-    # Step 3: Unescape single quotes (Chromium doesn't escape them)
-    $result = $result -replace '\\u0027', "'"
-
-    return $result
+    # Single pass over the precompiled pattern:
+    # 1. Convert all lowercase unicode escapes to uppercase
+    # 2. Unescape > (Chromium doesn't escape it)
+    # 3. Unescape single quotes (Chromium doesn't escape them)
+    return $script:UnicodeEscapeRegex.Replace($Json, $script:UnicodeEscapeEvaluator)
 }
 
 function ConvertTo-JsonForHmac {
@@ -369,6 +380,10 @@ function Get-PreferenceHmac {
     .PARAMETER Value
         The preference value.
 
+    .PARAMETER ValueJson
+        Optional pre-serialized value (output of ConvertTo-JsonForHmac). Callers that
+        also display or record the JSON can serialize once and pass it here.
+
     .OUTPUTS
         [string] The MAC as an uppercase hex string.
 
@@ -385,11 +400,17 @@ function Get-PreferenceHmac {
         [string]$Path,
 
         [Parameter()]
-        $Value
+        $Value,
+
+        [Parameter()]
+        [AllowEmptyString()]
+        [string]$ValueJson
     )
 
-    $valueJson = ConvertTo-JsonForHmac -Value $Value
-    $message = $DeviceId + $Path + $valueJson
+    if (-not $PSBoundParameters.ContainsKey('ValueJson')) {
+        $ValueJson = ConvertTo-JsonForHmac -Value $Value
+    }
+    $message = $DeviceId + $Path + $ValueJson
     return Get-HmacSha256 -Key $script:FileMacSeed -Message $message
 }
 
@@ -413,6 +434,10 @@ function Get-RegistryPreferenceHmac {
     .PARAMETER Value
         The preference value.
 
+    .PARAMETER ValueJson
+        Optional pre-serialized value (output of ConvertTo-JsonForHmac). Callers that
+        also display or record the JSON can serialize once and pass it here.
+
     .OUTPUTS
         [string] The MAC as an uppercase hex string.
 
@@ -429,11 +454,17 @@ function Get-RegistryPreferenceHmac {
         [string]$Path,
 
         [Parameter()]
-        $Value
+        $Value,
+
+        [Parameter()]
+        [AllowEmptyString()]
+        [string]$ValueJson
     )
 
-    $valueJson = ConvertTo-JsonForHmac -Value $Value
-    $message = $DeviceId + $Path + $valueJson
+    if (-not $PSBoundParameters.ContainsKey('ValueJson')) {
+        $ValueJson = ConvertTo-JsonForHmac -Value $Value
+    }
+    $message = $DeviceId + $Path + $ValueJson
     return Get-HmacSha256 -Key $script:RegistryMacSeed -Message $message
 }
 
@@ -478,8 +509,10 @@ function Get-PrefValue {
             return $null
         }
         elseif ($current -is [PSCustomObject]) {
-            if ($current.PSObject.Properties.Name -contains $part) {
-                $current = $current.$part
+            # Direct property lookup ($null when absent) instead of scanning Properties.Name
+            $prop = $current.PSObject.Properties[$part]
+            if ($null -ne $prop) {
+                $current = $prop.Value
             }
             else {
                 return $null
@@ -505,6 +538,42 @@ function Get-PrefValue {
 # HELPER FUNCTIONS
 # ============================================================================
 
+function Read-JsonFile {
+    <#
+    .SYNOPSIS
+        Read a JSON file once and return both the raw text and the parsed object.
+
+    .DESCRIPTION
+        Reads the file as UTF-8 in a single call and parses the same string, so scripts
+        that need the raw text (empty-array detection, raw object extraction) and the
+        parsed object don't open and decode the file twice.
+
+    .PARAMETER Path
+        Path to the JSON file.
+
+    .OUTPUTS
+        [PSCustomObject] with Raw ([string]) and Object (parsed JSON) properties.
+
+    .EXAMPLE
+        $json = Read-JsonFile -Path $SecurePrefsFile
+        $emptyArrayKeys = Get-RawJsonEmptyArrayKeys -RawJson $json.Raw
+    #>
+    [CmdletBinding()]
+    [OutputType([PSCustomObject])]
+    param(
+        [Parameter(Mandatory)]
+        [string]$Path
+    )
+
+    $resolvedPath = (Resolve-Path -LiteralPath $Path).ProviderPath
+    $raw = [System.IO.File]::ReadAllText($resolvedPath, [System.Text.Encoding]::UTF8)
+
+    return [PSCustomObject]@{
+        Raw    = $raw
+        Object = ConvertFrom-Json -InputObject $raw
+    }
+}
+
 function Test-RawJsonHasEmptyArray {
     <#
     .SYNOPSIS
@@ -542,6 +611,104 @@ function Test-RawJsonHasEmptyArray {
     return $RawJson -match $pattern
 }
 
+function Get-RawJsonEmptyArrayKeys {
+    <#
+    .SYNOPSIS
+        Collect every key that has an empty array [] in the raw JSON.
+
+    .DESCRIPTION
+        Single-pass alternative to Test-RawJsonHasEmptyArray for callers that probe
+        many keys against the same document: the raw JSON is scanned once and each
+        lookup afterwards is a set membership check.
+
+    .PARAMETER RawJson
+        The raw JSON string.
+
+    .OUTPUTS
+        [System.Collections.Generic.HashSet[string]] Key names with an empty array value.
+
+    .EXAMPLE
+        $emptyArrayKeys = Get-RawJsonEmptyArrayKeys -RawJson $json
+        if ($emptyArrayKeys.Contains("pinned_tabs")) { ... }
+    #>
+    [CmdletBinding()]
+    [OutputType([System.Collections.Generic.HashSet[string]])]
+    param(
+        [Parameter(Mandatory)]
+        [string]$RawJson
+    )
+
+    $keys = [System.Collections.Generic.HashSet[string]]::new([System.StringComparer]::OrdinalIgnoreCase)
+    foreach ($match in $script:EmptyArrayKeyRegex.Matches($RawJson)) {
+        [void]$keys.Add($match.Groups[1].Value)
+    }
+    return ,$keys
+}
+
+function Get-RawJsonObjectText {
+    <#
+    .SYNOPSIS
+        Extract the exact raw text of the object stored under a key.
+
+    .DESCRIPTION
+        Finds "key": in the raw JSON and returns the balanced {...} that follows,
+        character-for-character as it appears in the file (for comparing against our
+        own serialization). The scan tracks string literals and escapes, so braces
+        inside string values (CSP rules, URLs, descriptions) don't skew the depth count.
+
+    .PARAMETER RawJson
+        The raw JSON string.
+
+    .PARAMETER Key
+        The key whose object value to extract (first occurrence).
+
+    .OUTPUTS
+        [string] The raw object text, or $null if the key or a balanced object is not found.
+
+    .EXAMPLE
+        $rawExtJson = Get-RawJsonObjectText -RawJson $json -Key "mhjfbmdgcfjbbpaeojofohoefgiehjai"
+    #>
+    [CmdletBinding()]
+    [OutputType([string])]
+    param(
+        [Parameter(Mandatory)]
+        [string]$RawJson,
+
+        [Parameter(Mandatory)]
+        [string]$Key
+    )
+
+    $keyIndex = $RawJson.IndexOf("`"$Key`":", [System.StringComparison]::Ordinal)
+    if ($keyIndex -lt 0) {
+        return $null
+    }
+
+    $start = $RawJson.IndexOf('{', $keyIndex)
+    if ($start -lt 0) {
+        return $null
+    }
+
+    $depth = 0
+    $inString = $false
+    for ($i = $start; $i -lt $RawJson.Length; $i++) {
+        $char = $RawJson[$i]
+        if ($inString) {
+            if ($char -eq '\') { $i++ }  # Skip the escaped character
+            elseif ($char -eq '"') { $inString = $false }
+        }
+        elseif ($char -eq '"') { $inString = $true }
+        elseif ($char -eq '{') { $depth++ }
+        elseif ($char -eq '}') {
+            $depth--
+            if ($depth -eq 0) {
+                return $RawJson.Substring($start, $i - $start + 1)
+            }
+        }
+    }
+
+    return $null
+}
+
 function Get-MacsFromNestedObject {
     <#
     .SYNOPSIS
@@ -688,7 +855,10 @@ $ExportedFunctions = @(
     'Get-PreferenceHmac'
     'Get-RegistryPreferenceHmac'
     'Get-PrefValue'
+    'Read-JsonFile'
     'Test-RawJsonHasEmptyArray'
+    'Get-RawJsonEmptyArrayKeys'
+    'Get-RawJsonObjectText'
     'Get-MacsFromNestedObject'
     'Get-MeteorDataPath'
     'Get-SecurePreferencesPath'
@@ -31,51 +31,110 @@ import json
 import hashlib
 import hmac
 import sys
-from collections import OrderedDict
 
-# Load test data
-with open('browser-state.json') as f:
-    browser_state = json.load(f)
+try:
+    import orjson  # optional: compiled parser, same result as json.loads
+except ImportError:
+    orjson = None
+
+
+def load_json(path):
+    """Parse a UTF-8 JSON file from raw bytes (orjson when installed)."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
-with open('secure-preferences.json') as f:
-    secure_prefs = json.load(f)
+
+# Load test data
+browser_state = load_json('browser-state.json')
+secure_prefs = load_json('secure-preferences.json')
 
 DEVICE_ID = browser_state['device_id']
 FILE_SEED = browser_state['file_mac_seed']
 REGISTRY_SEED = browser_state['registry_mac_seed']
 
+_BAR = "=" * 80
+_HBAR = "-" * 40
 
-def hmac_sha256(key: str, message: str) -> str:
-    """Calculate HMAC-SHA256."""
-    key_bytes = key.encode('utf-8')
-    message_bytes = message.encode('utf-8')
-    return hmac.new(key_bytes, message_bytes, hashlib.sha256).hexdigest().upper()
+
+# key -> keyed HMAC object; copying it skips re-deriving the inner/outer pads
+_hmac_templates = {}
+
+
+def new_hmac(key: str):
+    """Return a fresh HMAC-SHA256 object keyed with `key` (copied from a template)."""
+    template = _hmac_templates.get(key)
+    if template is None:
+        template = hmac.new(key.encode('utf-8'), digestmod=hashlib.sha256)
+        _hmac_templates[key] = template
+    return template.copy()
 
 
 def prune_empty_recursive(obj):
     """
-    Recursively sort dictionary keys and PRUNE empty containers.
+    Sort dictionary keys and PRUNE empty containers, recursively.
 
     Chromium's PrefHashCalculator removes empty dict {} and list [] values
     from dict entries before computing MACs.
+
+    Walks the tree post-order with an explicit stack instead of recursing,
+    building plain dicts (insertion order is preserved on Python 3.7+).
     """
-    if isinstance(obj, dict):
-        result = OrderedDict()
-        for k in sorted(obj.keys()):
-            v = prune_empty_recursive(obj[k])
-            # PRUNE: Skip empty dicts and empty arrays
-            if isinstance(v, dict) and len(v) == 0:
-                continue
-            if isinstance(v, list) and len(v) == 0:
-                continue
-            result[k] = v
-        return result
-    elif isinstance(obj, list):
-        # Process list items but don't prune items from lists
-        return [prune_empty_recursive(item) for item in obj]
-    else:
+    if not isinstance(obj, (dict, list)):
         return obj
 
+    done = {}  # id(source container) -> processed container
+    stack = [(obj, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if not children_done:
+            stack.append((node, True))
+            children = node.values() if isinstance(node, dict) else node
+            stack.extend((c, False) for c in children if isinstance(c, (dict, list)))
+            continue
+
+        if isinstance(node, dict):
+            result = {}
+            for k in sorted(node):
+                v = done.get(id(node[k]), node[k])
+                # PRUNE: Skip empty dicts and empty arrays
+                if isinstance(v, (dict, list)) and not v:
+                    continue
+                result[k] = v
+        else:
+            # Process list items but don't prune items from lists
+            result = [done.get(id(item), item) for item in node]
+        done[id(node)] = result
+
+    return done[id(obj)]
+
+
+def dumps_compact(obj):
+    """Compact JSON with non-ASCII kept as-is.
+
+    Always stdlib json: this is HMAC input, and orjson formats floats (1e16 vs
+    1e+16) and NaN differently, which would change the MAC.
+    """
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+
+def _dumps_pruned(value):
+    """Prune, sort and serialize a dict/list value."""
+    return dumps_compact(prune_empty_recursive(value))
+
+
+_SERIALIZERS = {
+    type(None): lambda v: "",
+    bool: lambda v: "true" if v else "false",
+    int: str,
+    float: str,
+    str: lambda v: json.dumps(v, ensure_ascii=False),
+    list: lambda v: _dumps_pruned(v) if v else "[]",
+    dict: _dumps_pruned,
+}
+
 
 def value_to_json_chromium(value):
     """
@@ -89,6 +148,11 @@ def value_to_json_chromium(value):
     - string -> JSON quoted
     - number -> string representation
     """
+    # Exact-type fast path; subclasses fall through to the isinstance chain
+    handler = _SERIALIZERS.get(type(value))
+    if handler is not None:
+        return handler(value)
+
     if value is None:
         return ""
     elif isinstance(value, bool):
@@ -96,48 +160,73 @@ def value_to_json_chromium(value):
     elif isinstance(value, list):
         if len(value) == 0:
             return "[]"
-        sorted_val = prune_empty_recursive(value)
-        return json.dumps(sorted_val, separators=(',', ':'), ensure_ascii=False)
+        return _dumps_pruned(value)
     elif isinstance(value, dict):
-        sorted_val = prune_empty_recursive(value)
-        return json.dumps(sorted_val, separators=(',', ':'), ensure_ascii=False)
+        return _dumps_pruned(value)
     elif isinstance(value, str):
         return json.dumps(value, ensure_ascii=False)
     elif isinstance(value, (int, float)):
         return str(value)
     else:
-        sorted_val = prune_empty_recursive(value)
-        return json.dumps(sorted_val, separators=(',', ':'), ensure_ascii=False)
+        return dumps_compact(prune_empty_recursive(value))
+
+
+# (id(root), dotted parent path) -> resolved parent node
+_parent_cache = {}
 
 
 def get_value_at_path(obj, path):
-    """Navigate to a value at a dotted path."""
-    parts = path.split('.')
-    current = obj
-    for part in parts:
-        if current is None:
-            return None
-        if isinstance(current, dict):
-            current = current.get(part)
+    """
+    Navigate to a value at a dotted path.
+
+    Parent nodes are resolved once and cached, so sibling paths (e.g. the many
+    extensions.settings.<id> entries) only walk their last component.
+    """
+    parent_path, _, leaf = path.rpartition('.')
+    if parent_path:
+        key = (id(obj), parent_path)
+        if key in _parent_cache:
+            parent = _parent_cache[key]
         else:
-            return None
-    return current
+            parent = get_value_at_path(obj, parent_path)
+            _parent_cache[key] = parent
+    else:
+        parent = obj
+
+    if isinstance(parent, dict):
+        return parent.get(leaf)
+    return None
 
 
 def calculate_mac(seed, device_id, path, value):
-    """Calculate MAC for a preference."""
+    """Calculate MAC for a preference. Returns (mac, value_json)."""
     value_json = value_to_json_chromium(value)
-    message = device_id + path + value_json
-    return hmac_sha256(seed, message)
+    # Feed the message parts separately instead of building device_id + path + value_json
+    h = new_hmac(seed)
+    h.update(device_id.encode('utf-8'))
+    h.update(path.encode('utf-8'))
+    h.update(value_json.encode('utf-8'))
+    return h.hexdigest().upper(), value_json
+
+
+# Below this many paths a worker pool costs more to start than it saves
+PARALLEL_THRESHOLD = 64
+
+
+def verify_path(path):
+    """Compute the file MAC for one path. Returns (value, calculated_mac, value_json)."""
+    value = get_value_at_path(secure_prefs, path)
+    calculated_mac, value_json = calculate_mac(FILE_SEED, DEVICE_ID, path, value)
+    return value, calculated_mac, value_json
 
 
 def main():
     # Filter argument
     filter_path = sys.argv[1] if len(sys.argv) > 1 else ""
 
-    print("=" * 80)
+    print(_BAR)
     print("MAC CALCULATION ANALYSIS (Python)")
-    print("=" * 80)
+    print(_BAR)
     print()
     print(f"Device ID: {DEVICE_ID}")
     print(f"File Seed: '{FILE_SEED}' (empty)")
@@ -145,24 +234,36 @@ def main():
     print()
 
     # Analyze file MACs
-    print("=" * 80)
+    print(_BAR)
     print("FILE MACs")
-    print("=" * 80)
+    print(_BAR)
     print()
 
     passed = 0
     failed = 0
     failed_items = []
 
-    for path, expected_mac in browser_state['file_macs'].items():
-        if path == '_description':
-            continue
-        if filter_path and filter_path not in path:
-            continue
-
-        value = get_value_at_path(secure_prefs, path)
-        calculated_mac = calculate_mac(FILE_SEED, DEVICE_ID, path, value)
+    targets = [
+        (path, expected_mac)
+        for path, expected_mac in browser_state['file_macs'].items()
+        if path != '_description' and (not filter_path or filter_path in path)
+    ]
+    paths = [path for path, _ in targets]
+
+    # Each MAC is independent; large captures are spread over worker processes
+    # (json serialization is GIL-bound). Workers load the test data themselves
+    # at import, so only path strings and results cross the process boundary.
+    if len(paths) >= PARALLEL_THRESHOLD:
+        # Imported here, not at module top: concurrent.futures pulls in
+        # multiprocessing, which small captures (and every spawned worker
+        # re-importing this module) never need.
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(verify_path, paths, chunksize=16))
+    else:
+        results = [verify_path(path) for path in paths]
 
+    for (path, expected_mac), (value, calculated_mac, value_json) in zip(targets, results):
         if calculated_mac == expected_mac:
             print(f"[PASS] {path}")
             passed += 1
@@ -173,7 +274,8 @@ def main():
                 'path': path,
                 'expected': expected_mac,
                 'calculated': calculated_mac,
-                'value': value
+                'value': value,
+                'value_json': value_json
             })
 
     print()
@@ -182,9 +284,9 @@ def main():
 
     # Show failed items with details
     if failed_items:
-        print("=" * 80)
+        print(_BAR)
         print("FAILED ITEMS - DETAILED ANALYSIS")
-        print("=" * 80)
+        print(_BAR)
         print()
 
         for item in failed_items[:3]:  # Limit to first 3
@@ -193,8 +295,7 @@ def main():
             print(f"Calculated MAC: {item['calculated']}")
             print()
 
-            value_json = value_to_json_chromium(item['value'])
-            message = DEVICE_ID + item['path'] + value_json
+            value_json = item['value_json']
 
             print(f"Message components:")
             print(f"  Device ID: {DEVICE_ID}")
@@ -209,7 +310,7 @@ def main():
             else:
                 print(f"  Value JSON: {value_json}")
             print()
-            print("-" * 40)
+            print(_HBAR)
             print()
 
 
@@ -49,7 +49,8 @@ if (-not (Test-Path $SecurePrefsPath)) {
     exit 1
 }
 
-$rawJson = Get-Content $SecurePrefsPath -Raw -Encoding UTF8
+$securePrefsJson = Read-JsonFile -Path $SecurePrefsPath
+$rawJson = $securePrefsJson.Raw
 Write-Host "File: $SecurePrefsPath"
 Write-Host "Raw file length: $($rawJson.Length) chars"
 Write-Host ""
@@ -58,58 +59,36 @@ Write-Host ""
 $extPath = "extensions.settings.$ExtensionId"
 Write-Host "Extracting raw JSON for: $extPath" -ForegroundColor Cyan
 
-# Pattern to find the extension settings - this is tricky because JSON is nested
-# We'll use a simpler approach: find the start and count braces
-$searchKey = "`"$ExtensionId`":"
-$startIndex = $rawJson.IndexOf($searchKey)
+# Extract the balanced {...} that follows "<id>": (string-aware, so braces inside
+# values such as CSP strings or URLs don't end the object early)
+$rawExtJson = Get-RawJsonObjectText -RawJson $rawJson -Key $ExtensionId
 
-if ($startIndex -eq -1) {
+if ($null -eq $rawExtJson) {
     Write-Host "ERROR: Extension $ExtensionId not found in file" -ForegroundColor Red
 } else {
-    # Find the opening brace after the key
-    $braceStart = $rawJson.IndexOf("{", $startIndex)
-
-    # Count braces to find the matching close
-    $depth = 0
-    $braceEnd = -1
-    for ($i = $braceStart; $i -lt $rawJson.Length; $i++) {
-        $char = $rawJson[$i]
-        if ($char -eq '{') { $depth++ }
-        elseif ($char -eq '}') {
-            $depth--
-            if ($depth -eq 0) {
-                $braceEnd = $i
-                break
-            }
-        }
+    Write-Host ""
+    Write-Host "RAW JSON from file (first 500 chars):" -ForegroundColor Green
+    Write-Host $rawExtJson.Substring(0, [Math]::Min(500, $rawExtJson.Length))
+    if ($rawExtJson.Length -gt 500) {
+        Write-Host "... (truncated, total $($rawExtJson.Length) chars)"
     }
+    Write-Host ""
 
-    if ($braceEnd -gt $braceStart) {
-        $rawExtJson = $rawJson.Substring($braceStart, $braceEnd - $braceStart + 1)
-        Write-Host ""
-        Write-Host "RAW JSON from file (first 500 chars):" -ForegroundColor Green
-        Write-Host $rawExtJson.Substring(0, [Math]::Min(500, $rawExtJson.Length))
-        if ($rawExtJson.Length -gt 500) {
-            Write-Host "... (truncated, total $($rawExtJson.Length) chars)"
-        }
-        Write-Host ""
-
-        # Show specific patterns we care about
-        Write-Host "Key patterns in raw JSON:" -ForegroundColor Cyan
+    # Show specific patterns we care about
+    Write-Host "Key patterns in raw JSON:" -ForegroundColor Cyan
 
-        # Check for empty arrays
-        $emptyArrayMatches = [regex]::Matches($rawExtJson, '"([^"]+)":\s*\[\s*\]')
-        Write-Host "  Empty arrays ([]):"
-        foreach ($match in $emptyArrayMatches) {
-            Write-Host "    - $($match.Groups[1].Value)"
-        }
+    # Check for empty arrays
+    $emptyArrayMatches = [regex]::Matches($rawExtJson, '"([^"]+)":\s*\[\s*\]')
+    Write-Host "  Empty arrays ([]):"
+    foreach ($match in $emptyArrayMatches) {
+        Write-Host "    - $($match.Groups[1].Value)"
+    }
 
-        # Check for empty objects
-        $emptyObjMatches = [regex]::Matches($rawExtJson, '"([^"]+)":\s*\{\s*\}')
-        Write-Host "  Empty objects ({}):"
-        foreach ($match in $emptyObjMatches) {
-            Write-Host "    - $($match.Groups[1].Value)"
-        }
+    # Check for empty objects
+    $emptyObjMatches = [regex]::Matches($rawExtJson, '"([^"]+)":\s*\{\s*\}')
+    Write-Host "  Empty objects ({}):"
+    foreach ($match in $emptyObjMatches) {
+        Write-Host "    - $($match.Groups[1].Value)"
     }
 }
 
@@ -122,8 +101,8 @@ Write-Host ""
 Write-Host "=== PART 2: POWERSHELL ROUND-TRIP ===" -ForegroundColor Yellow
 Write-Host ""
 
-# Parse the entire file
-$parsed = $rawJson | ConvertFrom-Json
+# Parsed alongside the raw text by Read-JsonFile
+$parsed = $securePrefsJson.Object
 
 # Get the extension value
 $extValue = $parsed.extensions.settings.$ExtensionId
@@ -28,18 +28,31 @@ NOTE:
 import json
 import hashlib
 import hmac
-from collections import OrderedDict
 
-# Load test data
-with open('browser-state.json') as f:
-    browser_state = json.load(f)
+try:
+    import orjson  # optional: compiled parser, same result as json.loads
+except ImportError:
+    orjson = None
+
+
+def load_json(path):
+    """Parse a UTF-8 JSON file from raw bytes (orjson when installed)."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
-with open('secure-preferences.json') as f:
-    secure_prefs = json.load(f)
+
+# Load test data
+browser_state = load_json('browser-state.json')
+secure_prefs = load_json('secure-preferences.json')
 
 DEVICE_ID = browser_state['device_id']
 FILE_SEED = browser_state['file_mac_seed']
 
+_BAR = "=" * 80
+
 # Pick the simplest extension - comet_web_resources
 EXT_ID = 'mjdcklhepheaaemphcopihnmjlmjpcnh'
 PATH = f'extensions.settings.{EXT_ID}'
@@ -52,31 +65,51 @@ print()
 # Get the value
 value = secure_prefs['extensions']['settings'][EXT_ID]
 
-print("=" * 80)
+print(_BAR)
 print("RAW VALUE (Python dict)")
-print("=" * 80)
+print(_BAR)
 print(json.dumps(value, indent=2))
 print()
 
 def sort_dict_recursive(obj):
-    """Recursively sort dictionary keys alphabetically."""
-    if isinstance(obj, dict):
-        return OrderedDict(sorted((k, sort_dict_recursive(v)) for k, v in obj.items()))
-    elif isinstance(obj, list):
-        return [sort_dict_recursive(item) for item in obj]
-    else:
+    """Recursively sort dictionary keys alphabetically (iterative, plain dicts)."""
+    if not isinstance(obj, (dict, list)):
         return obj
 
+    done = {}  # id(source container) -> sorted container
+    stack = [(obj, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if not children_done:
+            stack.append((node, True))
+            children = node.values() if isinstance(node, dict) else node
+            stack.extend((c, False) for c in children if isinstance(c, (dict, list)))
+            continue
+
+        if isinstance(node, dict):
+            done[id(node)] = {k: done.get(id(node[k]), node[k]) for k in sorted(node)}
+        else:
+            done[id(node)] = [done.get(id(item), item) for item in node]
+
+    return done[id(obj)]
+
+# key -> keyed HMAC object; copying it skips re-deriving the inner/outer pads
+_hmac_templates = {}
+
 def hmac_sha256(key: str, message: str) -> str:
     """Calculate HMAC-SHA256."""
-    key_bytes = key.encode('utf-8')
-    message_bytes = message.encode('utf-8')
-    return hmac.new(key_bytes, message_bytes, hashlib.sha256).hexdigest().upper()
+    template = _hmac_templates.get(key)
+    if template is None:
+        template = hmac.new(key.encode('utf-8'), digestmod=hashlib.sha256)
+        _hmac_templates[key] = template
+    h = template.copy()
+    h.update(message.encode('utf-8'))
+    return h.hexdigest().upper()
 
 # Different JSON serialization approaches
-print("=" * 80)
+print(_BAR)
 print("JSON SERIALIZATION EXPERIMENTS")
-print("=" * 80)
+print(_BAR)
 print()
 
 sorted_val = sort_dict_recursive(value)
@@ -106,9 +139,9 @@ print(f"   Match: {mac3 == EXPECTED_MAC}")
 print()
 
 # Check for specific differences in key order
-print("=" * 80)
+print(_BAR)
 print("KEY ORDER ANALYSIS")
-print("=" * 80)
+print(_BAR)
 print()
 
 print("Top-level keys in original order:")
@@ -133,9 +166,9 @@ else:
             print(f"   Position {i}: original='{o}', sorted='{s}'")
 
 print()
-print("=" * 80)
+print(_BAR)
 print("DETAILED JSON OUTPUT")
-print("=" * 80)
+print(_BAR)
 print()
 print(f"JSON length: {len(json1)} chars")
 print()
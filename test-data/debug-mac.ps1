@@ -46,7 +46,7 @@ Write-Host ""
 $securePrefsFile = Get-SecurePreferencesPath
 
 if (Test-Path $securePrefsFile) {
-    $prefs = Get-Content $securePrefsFile -Raw | ConvertFrom-Json
+    $prefs = (Read-JsonFile -Path $securePrefsFile).Object
     $actualMac = $prefs.protection.macs.browser.show_home_button
     Write-Host "Actual MAC from file: $actualMac"
     Write-Host ""
@@ -226,9 +226,11 @@ function Get-HmacSha256 {
     $keyBytes = [System.Text.Encoding]::UTF8.GetBytes($Key)
     $messageBytes = [System.Text.Encoding]::UTF8.GetBytes($Message)
     $hmac = New-Object System.Security.Cryptography.HMACSHA256
-    $hmac.Key = $keyBytes
-    $hashBytes = $hmac.ComputeHash($messageBytes)
-    return ($hashBytes | ForEach-Object { $_.ToString("X2") }) -join ""
+    try {
+        $hmac.Key = $keyBytes
+        $hashBytes = $hmac.ComputeHash($messageBytes)
+    } finally { $hmac.Dispose() }
+    return [BitConverter]::ToString($hashBytes).Replace("-", "")
 }
 
 $seed = ""  # Empty for Comet file MACs
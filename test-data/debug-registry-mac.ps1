@@ -28,8 +28,7 @@ Write-Host ""
 
 # Read from Secure Preferences
 $securePrefsFile = Get-SecurePreferencesPath
-$rawJson = Get-Content $securePrefsFile -Raw
-$prefs = $rawJson | ConvertFrom-Json
+$prefs = (Read-JsonFile -Path $securePrefsFile).Object
 
 # Get extension value
 $extValue = $prefs.extensions.settings.$extensionId
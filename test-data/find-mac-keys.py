@@ -33,18 +33,31 @@ import json
 import hashlib
 import hmac
 import itertools
-from collections import OrderedDict
 
-# Load test data
-with open('browser-state.json') as f:
-    browser_state = json.load(f)
+try:
+    import orjson  # optional: compiled parser, same result as json.loads
+except ImportError:
+    orjson = None
+
 
-with open('secure-preferences.json') as f:
-    secure_prefs = json.load(f)
+def load_json(path):
+    """Parse a UTF-8 JSON file from raw bytes (orjson when installed)."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Load test data
+browser_state = load_json('browser-state.json')
+secure_prefs = load_json('secure-preferences.json')
 
 DEVICE_ID = browser_state['device_id']
 FILE_SEED = browser_state['file_mac_seed']
 
+_BAR = "=" * 60
+
 # Target: simplest extension
 EXT_ID = 'mjdcklhepheaaemphcopihnmjlmjpcnh'
 PATH = f'extensions.settings.{EXT_ID}'
@@ -58,35 +71,53 @@ print(f"Current keys: {sorted(value.keys())}")
 print()
 
 
-def hmac_sha256(key: str, message: str) -> str:
-    key_bytes = key.encode('utf-8')
-    message_bytes = message.encode('utf-8')
-    return hmac.new(key_bytes, message_bytes, hashlib.sha256).hexdigest().upper()
+# Every candidate below shares the seed and the DEVICE_ID + PATH message prefix,
+# so key the HMAC and feed the prefix once; each candidate copies this state
+# and appends only its JSON
+_PREFIX_HMAC = hmac.new(FILE_SEED.encode('utf-8'), (DEVICE_ID + PATH).encode('utf-8'), hashlib.sha256)
+
+
+def json_mac(json_str: str) -> str:
+    h = _PREFIX_HMAC.copy()
+    h.update(json_str.encode('utf-8'))
+    return h.hexdigest().upper()
 
 
 def sort_dict_recursive(obj):
     if isinstance(obj, dict):
-        return OrderedDict(sorted((k, sort_dict_recursive(v)) for k, v in obj.items()))
+        return {k: sort_dict_recursive(v) for k, v in sorted(obj.items())}
     elif isinstance(obj, list):
         return [sort_dict_recursive(item) for item in obj]
     else:
         return obj
 
 
+def dumps_compact(obj):
+    # Always stdlib json: this is HMAC input, and orjson formats floats and NaN differently
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+
 def calc_mac(val):
     sorted_val = sort_dict_recursive(val)
-    json_str = json.dumps(sorted_val, separators=(',', ':'), ensure_ascii=False)
-    return hmac_sha256(FILE_SEED, DEVICE_ID + PATH + json_str)
+    json_str = dumps_compact(sorted_val)
+    return json_mac(json_str)
 
 
 # Test 1: Check if any SINGLE key removal produces the correct MAC
-print("=" * 60)
+print(_BAR)
 print("TEST 1: Removing single keys")
-print("=" * 60)
+print(_BAR)
 
-for key in sorted(value.keys()):
-    test_val = {k: v for k, v in value.items() if k != key}
-    mac = calc_mac(test_val)
+# Serialize each top-level entry once; every exclusion is then a join of the
+# remaining fragments instead of a full re-sort and re-dump of the value
+fragments = [
+    (k, json.dumps(k, ensure_ascii=False) + ':' + dumps_compact(sort_dict_recursive(value[k])))
+    for k in sorted(value.keys())
+]
+
+for key, _ in fragments:
+    json_str = '{' + ','.join(frag for k, frag in fragments if k != key) + '}'
+    mac = json_mac(json_str)
     if mac == EXPECTED_MAC:
         print(f"MATCH! Removing '{key}' gives correct MAC")
         break
@@ -96,9 +127,9 @@ else:
 print()
 
 # Test 2: Check common runtime-only keys that Chromium might exclude
-print("=" * 60)
+print(_BAR)
 print("TEST 2: Removing common runtime keys")
-print("=" * 60)
+print(_BAR)
 
 # Keys that might be runtime-only
 runtime_keys = [
@@ -127,9 +158,9 @@ for exclude_list in [
 print()
 
 # Test 3: Check if maybe ONLY certain keys are included
-print("=" * 60)
+print(_BAR)
 print("TEST 3: Checking core-only keys")
-print("=" * 60)
+print(_BAR)
 
 # Keys that are likely always needed for extension identification
 core_keys = [
@@ -162,9 +193,9 @@ for key in sorted(value.keys()):
 print()
 
 # Test 4: Check different JSON formats
-print("=" * 60)
+print(_BAR)
 print("TEST 4: Different JSON serialization formats")
-print("=" * 60)
+print(_BAR)
 
 sorted_val = sort_dict_recursive(value)
 
@@ -178,16 +209,16 @@ formats = [
 ]
 
 for name, json_str in formats:
-    mac = hmac_sha256(FILE_SEED, DEVICE_ID + PATH + json_str)
+    mac = json_mac(json_str)
     match = "MATCH!" if mac == EXPECTED_MAC else ""
     print(f"{name}: {match or 'no match'}")
 
 print()
 
 # Test 5: Check if path separators matter
-print("=" * 60)
+print(_BAR)
 print("TEST 5: Path separator variations")
-print("=" * 60)
+print(_BAR)
 
 # The path has backslashes - test forward slashes
 test_val = dict(value)
@@ -205,9 +236,9 @@ for name, path_val in variations:
     print(f"{name}: {match or 'no match'}")
 
 print()
-print("=" * 60)
+print(_BAR)
 print("COMPUTED JSON SAMPLE")
-print("=" * 60)
+print(_BAR)
 sorted_val = sort_dict_recursive(value)
 json_str = json.dumps(sorted_val, separators=(',', ':'), ensure_ascii=False)
 print(f"Length: {len(json_str)}")
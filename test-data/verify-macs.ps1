@@ -18,6 +18,10 @@
 .PARAMETER FilterPath
     Only test paths containing this substring.
 
+.PARAMETER FailFast
+    Stop at the first MAC mismatch instead of checking every path. Useful as a
+    quick pass/fail gate; the summary then only covers the paths checked so far.
+
 .NOTES
     Run from the meteor_v2 directory:
     .\test-data\verify-macs.ps1
@@ -28,7 +32,8 @@ param(
     [string]$DataPath = "",
     [switch]$Verbose,
     [switch]$ShowValues,
-    [string]$FilterPath = ""
+    [string]$FilterPath = "",
+    [switch]$FailFast
 )
 
 $ErrorActionPreference = "Stop"
@@ -73,8 +78,12 @@ if (-not (Test-Path $SecurePrefsFile)) {
 
 Write-Host "Reading: $SecurePrefsFile"
 
-$securePrefsRaw = Get-Content $SecurePrefsFile -Raw -Encoding UTF8
-$securePrefs = $securePrefsRaw | ConvertFrom-Json
+$securePrefsJson = Read-JsonFile -Path $SecurePrefsFile
+$securePrefsRaw = $securePrefsJson.Raw
+$securePrefs = $securePrefsJson.Object
+
+# Keys with an empty array in the raw JSON (PS5.1 converts [] to $null), collected in one pass
+$emptyArrayKeys = Get-RawJsonEmptyArrayKeys -RawJson $securePrefsRaw
 
 # Extract file MACs from protection.macs
 $fileMacs = @{}
@@ -131,141 +140,107 @@ else {
 Write-Host ""
 
 # ============================================================================
-# FILE MACs VERIFICATION
+# MAC VERIFICATION
 # ============================================================================
 
-$totalTests = 0
-$passedTests = 0
-$failedTests = @()
-
-Write-Host "=" * 80 -ForegroundColor Yellow
-Write-Host "FILE MACs VERIFICATION" -ForegroundColor Yellow
-Write-Host "=" * 80 -ForegroundColor Yellow
-Write-Host ""
-
-foreach ($path in ($fileMacs.Keys | Sort-Object)) {
-    # Apply filter if specified
-    if ($FilterPath -and $path -notlike "*$FilterPath*") { continue }
-
-    $expectedMac = $fileMacs[$path]
-
-    # Get the actual value from secure preferences
-    $value = Get-PrefValue -Root $securePrefs -Path $path
-
-    # Check if this is an empty array in the raw JSON (PS5.1 converts [] to $null)
-    if ($null -eq $value) {
-        $lastPart = ($path -split '\.')[-1]
-        if (Test-RawJsonHasEmptyArray -RawJson $securePrefsRaw -Key $lastPart) {
-            $value = @()
-        }
+# File and registry MACs differ only in the HMAC seed, so both are driven
+# through the same loop. Each suite accumulates its own counters and failures.
+$suites = @(
+    @{
+        Title = "FILE MACs"
+        Label = "File MACs:    "
+        Macs = $fileMacs
+        HmacFunction = 'Get-PreferenceHmac'
+        Total = 0
+        Passed = 0
+        Failed = [System.Collections.Generic.List[hashtable]]::new()
     }
-
-    # Calculate MAC
-    $calculatedMac = Get-PreferenceHmac -DeviceId $deviceId -Path $path -Value $value
-
-    $totalTests++
-    $match = $calculatedMac -eq $expectedMac
-
-    if ($match) {
-        $passedTests++
-        $status = "[PASS]"
-        $color = "Green"
-    }
-    else {
-        $status = "[FAIL]"
-        $color = "Red"
-        $failedTests += @{
-            Path = $path
-            Expected = $expectedMac
-            Calculated = $calculatedMac
-            Value = $value
-            ValueJson = (ConvertTo-JsonForHmac -Value $value)
-        }
+    @{
+        Title = "REGISTRY MACs"
+        Label = "Registry MACs:"
+        Macs = $registryMacs
+        HmacFunction = 'Get-RegistryPreferenceHmac'
+        Total = 0
+        Passed = 0
+        Failed = [System.Collections.Generic.List[hashtable]]::new()
     }
+)
 
-    Write-Host "$status $path" -ForegroundColor $color
+$firstSuite = $true
+$stoppedEarly = $false
+foreach ($suite in $suites) {
+    if ($stoppedEarly) { break }
+    if (-not $firstSuite) { Write-Host "" }
+    $firstSuite = $false
 
-    if ($Verbose -or (-not $match)) {
-        $valueJson = ConvertTo-JsonForHmac -Value $value
-        if ($valueJson.Length -gt 80) {
-            $valueJson = $valueJson.Substring(0, 77) + "..."
-        }
-        Write-Host "       Value JSON: $valueJson" -ForegroundColor DarkGray
-    }
+    Write-Host "=" * 80 -ForegroundColor Yellow
+    Write-Host "$($suite.Title) VERIFICATION" -ForegroundColor Yellow
+    Write-Host "=" * 80 -ForegroundColor Yellow
+    Write-Host ""
 
-    if (-not $match) {
-        Write-Host "       Expected:   $expectedMac" -ForegroundColor DarkGray
-        Write-Host "       Calculated: $calculatedMac" -ForegroundColor DarkGray
-    }
-}
+    $macs = $suite.Macs
+    foreach ($path in ($macs.Keys | Sort-Object)) {
+        # Apply filter if specified
+        if ($FilterPath -and $path.IndexOf($FilterPath, [System.StringComparison]::OrdinalIgnoreCase) -lt 0) { continue }
 
-# ============================================================================
-# REGISTRY MACs VERIFICATION
-# ============================================================================
+        $expectedMac = $macs[$path]
 
-Write-Host ""
-Write-Host "=" * 80 -ForegroundColor Yellow
-Write-Host "REGISTRY MACs VERIFICATION" -ForegroundColor Yellow
-Write-Host "=" * 80 -ForegroundColor Yellow
-Write-Host ""
+        # Get the actual value from secure preferences
+        $value = Get-PrefValue -Root $securePrefs -Path $path
 
-$regPassedTests = 0
-$regTotalTests = 0
-$regFailedTests = @()
+        # Check if this is an empty array in the raw JSON (PS5.1 converts [] to $null)
+        if ($null -eq $value) {
+            $lastPart = ($path -split '\.')[-1]
+            if ($emptyArrayKeys.Contains($lastPart)) {
+                $value = @()
+            }
+        }
 
-foreach ($path in ($registryMacs.Keys | Sort-Object)) {
-    # Apply filter if specified
-    if ($FilterPath -and $path -notlike "*$FilterPath*") { continue }
+        # Serialize once; reused for the MAC, the failure record and the display below
+        $valueJson = ConvertTo-JsonForHmac -Value $value
 
-    $expectedMac = $registryMacs[$path]
+        # Calculate MAC with the suite's seed
+        $calculatedMac = & $suite.HmacFunction -DeviceId $deviceId -Path $path -Value $value -ValueJson $valueJson
 
-    # Get the actual value from secure preferences
-    $value = Get-PrefValue -Root $securePrefs -Path $path
+        $suite.Total++
+        $match = $calculatedMac -eq $expectedMac
 
-    # Check if this is an empty array in the raw JSON
-    if ($null -eq $value) {
-        $lastPart = ($path -split '\.')[-1]
-        if (Test-RawJsonHasEmptyArray -RawJson $securePrefsRaw -Key $lastPart) {
-            $value = @()
+        if ($match) {
+            $suite.Passed++
+            $status = "[PASS]"
+            $color = "Green"
+        }
+        else {
+            $status = "[FAIL]"
+            $color = "Red"
+            $suite.Failed.Add(@{
+                Path = $path
+                Expected = $expectedMac
+                Calculated = $calculatedMac
+                Value = $value
+                ValueJson = $valueJson
+            })
         }
-    }
-
-    # Calculate MAC with registry seed
-    $calculatedMac = Get-RegistryPreferenceHmac -DeviceId $deviceId -Path $path -Value $value
 
-    $regTotalTests++
-    $match = $calculatedMac -eq $expectedMac
+        Write-Host "$status $path" -ForegroundColor $color
 
-    if ($match) {
-        $regPassedTests++
-        $status = "[PASS]"
-        $color = "Green"
-    }
-    else {
-        $status = "[FAIL]"
-        $color = "Red"
-        $regFailedTests += @{
-            Path = $path
-            Expected = $expectedMac
-            Calculated = $calculatedMac
-            Value = $value
-            ValueJson = (ConvertTo-JsonForHmac -Value $value)
+        if ($Verbose -or (-not $match)) {
+            $displayJson = $valueJson
+            if ($displayJson.Length -gt 80) {
+                $displayJson = $displayJson.Substring(0, 77) + "..."
+            }
+            Write-Host "       Value JSON: $displayJson" -ForegroundColor DarkGray
         }
-    }
 
-    Write-Host "$status $path" -ForegroundColor $color
+        if (-not $match) {
+            Write-Host "       Expected:   $expectedMac" -ForegroundColor DarkGray
+            Write-Host "       Calculated: $calculatedMac" -ForegroundColor DarkGray
 
-    if ($Verbose -or (-not $match)) {
-        $valueJson = ConvertTo-JsonForHmac -Value $value
-        if ($valueJson.Length -gt 80) {
-            $valueJson = $valueJson.Substring(0, 77) + "..."
+            if ($FailFast) {
+                $stoppedEarly = $true
+                break
+            }
         }
-        Write-Host "       Value JSON: $valueJson" -ForegroundColor DarkGray
-    }
-
-    if (-not $match) {
-        Write-Host "       Expected:   $expectedMac" -ForegroundColor DarkGray
-        Write-Host "       Calculated: $calculatedMac" -ForegroundColor DarkGray
     }
 }
 
@@ -279,57 +254,48 @@ Write-Host "SUMMARY" -ForegroundColor Cyan
 Write-Host "=" * 80 -ForegroundColor Cyan
 Write-Host ""
 
-$fileFailed = $totalTests - $passedTests
-$regFailed = $regTotalTests - $regPassedTests
-
-Write-Host "File MACs:     $passedTests/$totalTests passed" -ForegroundColor $(if ($fileFailed -eq 0) { "Green" } else { "Yellow" })
-Write-Host "Registry MACs: $regPassedTests/$regTotalTests passed" -ForegroundColor $(if ($regFailed -eq 0) { "Green" } else { "Yellow" })
+$anyFailed = $false
+foreach ($suite in $suites) {
+    $suiteFailed = $suite.Total - $suite.Passed
+    if ($suiteFailed -gt 0) { $anyFailed = $true }
+    Write-Host "$($suite.Label) $($suite.Passed)/$($suite.Total) passed" -ForegroundColor $(if ($suiteFailed -eq 0) { "Green" } else { "Yellow" })
+}
 Write-Host ""
 
-if ($failedTests.Count -gt 0 -and $ShowValues) {
-    Write-Host "=" * 80 -ForegroundColor Red
-    Write-Host "FAILED FILE MACs - DETAILED VALUES" -ForegroundColor Red
-    Write-Host "=" * 80 -ForegroundColor Red
+if ($stoppedEarly) {
+    Write-Host "Stopped at the first failure (-FailFast); remaining paths were not checked" -ForegroundColor Yellow
     Write-Host ""
-
-    foreach ($failed in $failedTests) {
-        Write-Host "Path: $($failed.Path)" -ForegroundColor Yellow
-        Write-Host "Value JSON:" -ForegroundColor White
-        Write-Host $failed.ValueJson
-        Write-Host ""
-        Write-Host "Expected MAC:   $($failed.Expected)" -ForegroundColor DarkGray
-        Write-Host "Calculated MAC: $($failed.Calculated)" -ForegroundColor DarkGray
-        Write-Host ""
-        Write-Host "-" * 40
-        Write-Host ""
-    }
 }
 
-if ($regFailedTests.Count -gt 0 -and $ShowValues) {
-    Write-Host "=" * 80 -ForegroundColor Red
-    Write-Host "FAILED REGISTRY MACs - DETAILED VALUES" -ForegroundColor Red
-    Write-Host "=" * 80 -ForegroundColor Red
-    Write-Host ""
+if ($ShowValues) {
+    foreach ($suite in $suites) {
+        if ($suite.Failed.Count -eq 0) { continue }
 
-    foreach ($failed in $regFailedTests) {
-        Write-Host "Path: $($failed.Path)" -ForegroundColor Yellow
-        Write-Host "Value JSON:" -ForegroundColor White
-        Write-Host $failed.ValueJson
-        Write-Host ""
-        Write-Host "Expected MAC:   $($failed.Expected)" -ForegroundColor DarkGray
-        Write-Host "Calculated MAC: $($failed.Calculated)" -ForegroundColor DarkGray
-        Write-Host ""
-        Write-Host "-" * 40
+        Write-Host "=" * 80 -ForegroundColor Red
+        Write-Host "FAILED $($suite.Title) - DETAILED VALUES" -ForegroundColor Red
+        Write-Host "=" * 80 -ForegroundColor Red
         Write-Host ""
+
+        foreach ($failed in $suite.Failed) {
+            Write-Host "Path: $($failed.Path)" -ForegroundColor Yellow
+            Write-Host "Value JSON:" -ForegroundColor White
+            Write-Host $failed.ValueJson
+            Write-Host ""
+            Write-Host "Expected MAC:   $($failed.Expected)" -ForegroundColor DarkGray
+            Write-Host "Calculated MAC: $($failed.Calculated)" -ForegroundColor DarkGray
+            Write-Host ""
+            Write-Host "-" * 40
+            Write-Host ""
+        }
     }
 }
 
-if ($fileFailed -gt 0 -or $regFailed -gt 0) {
+if ($anyFailed) {
     Write-Host "HINT: Run with -ShowValues to see full JSON values for failed MACs" -ForegroundColor Yellow
     Write-Host "HINT: Run with -FilterPath 'extensions.settings' to focus on specific paths" -ForegroundColor Yellow
 }
 
 # Exit with error code if any failures
-if ($fileFailed -gt 0 -or $regFailed -gt 0) {
+if ($anyFailed) {
     exit 1
 }